@@ -0,0 +1,64 @@
+"""add exercise_daily_stats
+
+Revision ID: 0da8d8d5c8bd
+Revises: 4d1decb2c671
+Create Date: 2026-10-18 11:03:17.208455
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0da8d8d5c8bd'
+down_revision: Union[str, Sequence[str], None] = '4d1decb2c671'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('exercise_daily_stats',
+    sa.Column('exercise_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('set_count', sa.Integer(), nullable=False),
+    sa.Column('best_set_volume', sa.Numeric(precision=12, scale=2), nullable=True),
+    sa.Column('total_volume', sa.Numeric(precision=14, scale=2), nullable=True),
+    sa.Column('best_duration_seconds', sa.Integer(), nullable=True),
+    sa.Column('total_duration_seconds', sa.Integer(), nullable=True),
+    sa.Column('best_distance_meters', sa.Integer(), nullable=True),
+    sa.Column('total_distance_meters', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercises.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('exercise_id', 'day')
+    )
+    op.create_index(op.f('ix_exercise_daily_stats_user_id'), 'exercise_daily_stats', ['user_id'], unique=False)
+
+    # Backfill from existing sets (same logic as rebuild_daily_stats)
+    op.execute(
+        """
+        INSERT INTO exercise_daily_stats (
+            user_id, exercise_id, day, set_count,
+            best_set_volume, total_volume,
+            best_duration_seconds, total_duration_seconds,
+            best_distance_meters, total_distance_meters
+        )
+        SELECT e.user_id, s.exercise_id, date(timezone('UTC', w.started_at)), count(s.id),
+               max(s.weight_kg * s.reps), sum(s.weight_kg * s.reps),
+               max(s.duration_seconds), sum(s.duration_seconds),
+               max(s.distance_meters), sum(s.distance_meters)
+        FROM workout_sets s
+        JOIN workouts w ON w.id = s.workout_id
+        JOIN exercises e ON e.id = s.exercise_id
+        GROUP BY e.user_id, s.exercise_id, date(timezone('UTC', w.started_at))
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_exercise_daily_stats_user_id'), table_name='exercise_daily_stats')
+    op.drop_table('exercise_daily_stats')
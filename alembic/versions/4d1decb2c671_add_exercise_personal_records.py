@@ -0,0 +1,68 @@
+"""add exercise_personal_records
+
+Revision ID: 4d1decb2c671
+Revises: 8a4b78f27bb5
+Create Date: 2026-10-18 10:12:41.531207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d1decb2c671'
+down_revision: Union[str, Sequence[str], None] = '8a4b78f27bb5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('exercise_personal_records',
+    sa.Column('exercise_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('best_weight_kg', sa.Numeric(precision=6, scale=2), nullable=True),
+    sa.Column('best_reps', sa.Integer(), nullable=True),
+    sa.Column('best_weight_set_id', sa.Integer(), nullable=True),
+    sa.Column('best_duration_seconds', sa.Integer(), nullable=True),
+    sa.Column('best_distance_meters', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercises.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('exercise_id')
+    )
+    op.create_index(op.f('ix_exercise_personal_records_user_id'), 'exercise_personal_records', ['user_id'], unique=False)
+
+    # Backfill from existing sets (same logic as rebuild_personal_records)
+    op.execute(
+        """
+        INSERT INTO exercise_personal_records (
+            exercise_id, user_id, best_weight_kg, best_reps, best_weight_set_id,
+            best_duration_seconds, best_distance_meters
+        )
+        SELECT o.exercise_id, o.user_id, w.weight_kg, w.reps, w.set_id,
+               o.duration_seconds, o.distance_meters
+        FROM (
+            SELECT s.exercise_id, e.user_id,
+                   max(s.duration_seconds) AS duration_seconds,
+                   max(s.distance_meters) AS distance_meters
+            FROM workout_sets s
+            JOIN exercises e ON e.id = s.exercise_id
+            GROUP BY s.exercise_id, e.user_id
+        ) o
+        LEFT JOIN (
+            SELECT DISTINCT ON (exercise_id)
+                   exercise_id, weight_kg, reps, id AS set_id
+            FROM workout_sets
+            WHERE weight_kg IS NOT NULL
+            ORDER BY exercise_id, weight_kg DESC, reps DESC NULLS LAST, id ASC
+        ) w ON w.exercise_id = o.exercise_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_exercise_personal_records_user_id'), table_name='exercise_personal_records')
+    op.drop_table('exercise_personal_records')
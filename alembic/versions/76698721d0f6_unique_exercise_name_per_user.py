@@ -0,0 +1,62 @@
+"""unique exercise name per user
+
+Revision ID: 76698721d0f6
+Revises: ad7f5db19f4e
+Create Date: 2026-10-18 17:22:03.904116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '76698721d0f6'
+down_revision: Union[str, Sequence[str], None] = 'ad7f5db19f4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Duplicates that slipped past the old read-then-write check: keep the oldest
+    # name as is and suffix the others with their id so no data is lost
+    op.execute(
+        """
+        UPDATE exercises e
+        SET name = left(e.name, 190) || ' (' || e.id || ')',
+            name_normalized = left(e.name_normalized, 190) || ' (' || e.id || ')'
+        WHERE EXISTS (
+            SELECT 1 FROM exercises o
+            WHERE o.user_id = e.user_id
+              AND o.name_normalized = e.name_normalized
+              AND o.id < e.id
+        )
+        """
+    )
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_exercises_user_id_name_normalized',
+            'exercises',
+            ['user_id', 'name_normalized'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.execute(
+            "ALTER TABLE exercises ADD CONSTRAINT uq_exercises_user_id_name_normalized "
+            "UNIQUE USING INDEX uq_exercises_user_id_name_normalized"
+        )
+
+        # Every name lookup also filters on user_id -> covered by the constraint
+        op.drop_index('ix_exercises_name_normalized', table_name='exercises', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_exercises_name_normalized', 'exercises', ['name_normalized'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+    op.drop_constraint('uq_exercises_user_id_name_normalized', 'exercises', type_='unique')
@@ -0,0 +1,35 @@
+"""add catalog_versions
+
+Revision ID: ad7f5db19f4e
+Revises: 88ba895b1f1d
+Create Date: 2026-10-18 16:05:12.418730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ad7f5db19f4e'
+down_revision: Union[str, Sequence[str], None] = '88ba895b1f1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('catalog_versions',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+    op.execute("INSERT INTO catalog_versions (name, version) VALUES ('exercise_templates', 1)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('catalog_versions')
@@ -0,0 +1,58 @@
+"""composite indexes for hot queries
+
+Revision ID: b68573381fa1
+Revises: 5d64b0e8268a
+Create Date: 2026-10-18 13:40:52.117630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b68573381fa1'
+down_revision: Union[str, Sequence[str], None] = '5d64b0e8268a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_workout_sets_exercise_id_workout_id',
+            'workout_sets',
+            ['exercise_id', 'workout_id'],
+            unique=False,
+            postgresql_include=['weight_kg', 'reps', 'duration_seconds', 'distance_meters'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_workout_sets_workout_id_exercise_id_set_number',
+            'workout_sets',
+            ['workout_id', 'exercise_id', 'set_number'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # Now covered by the leading columns of the composite indexes
+        op.drop_index('ix_workout_sets_exercise_id', table_name='workout_sets', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_workout_sets_workout_id', table_name='workout_sets', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_workouts_user_id', table_name='workouts', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_exercises_user_id', table_name='exercises', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_exercises_user_id', 'exercises', ['user_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_workouts_user_id', 'workouts', ['user_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_workout_sets_workout_id', 'workout_sets', ['workout_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_workout_sets_exercise_id', 'workout_sets', ['exercise_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+        op.drop_index('ix_workout_sets_workout_id_exercise_id_set_number', table_name='workout_sets', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_workout_sets_exercise_id_workout_id', table_name='workout_sets', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,53 @@
+"""add trigram search indexes
+
+Revision ID: bcceb030b6d1
+Revises: b68573381fa1
+Create Date: 2026-10-18 14:58:09.630871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bcceb030b6d1'
+down_revision: Union[str, Sequence[str], None] = 'b68573381fa1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_exercises_name_normalized_trgm',
+            'exercises',
+            ['name_normalized'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'name_normalized': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_exercise_templates_name_trgm',
+            'exercise_templates',
+            ['name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_exercise_templates_name_trgm', table_name='exercise_templates', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_exercises_name_normalized_trgm', table_name='exercises', postgresql_concurrently=True, if_exists=True)
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,29 @@
+"""add exercise_templates content_hash
+
+Revision ID: c52695480c9a
+Revises: 76698721d0f6
+Create Date: 2026-10-18 17:58:36.271455
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c52695480c9a'
+down_revision: Union[str, Sequence[str], None] = '76698721d0f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Left NULL: the next seed run fills it (every row counts as updated once)
+    op.add_column('exercise_templates', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('exercise_templates', 'content_hash')
@@ -0,0 +1,46 @@
+"""add exercise_templates search_vector
+
+Revision ID: c739b1b5b41c
+Revises: bcceb030b6d1
+Create Date: 2026-10-18 15:47:33.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c739b1b5b41c'
+down_revision: Union[str, Sequence[str], None] = 'bcceb030b6d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(name, '')), 'A') || "
+    "setweight(jsonb_to_tsvector('english'::regconfig, primary_muscles || secondary_muscles, "
+    "'[\"string\"]'), 'B') || "
+    "setweight(jsonb_to_tsvector('english'::regconfig, instructions, '[\"string\"]'), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'exercise_templates',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    # Catalog is small and effectively static -> plain (non-concurrent) build is fine
+    op.create_index('ix_exercise_templates_search_vector', 'exercise_templates', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_exercise_templates_search_vector', table_name='exercise_templates', postgresql_using='gin')
+    op.drop_column('exercise_templates', 'search_vector')
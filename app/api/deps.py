@@ -1,27 +1,37 @@
-from collections.abc import Generator
+import asyncio
+from collections.abc import AsyncGenerator
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import SessionLocal
+from app.core.config import settings
+from app.core.db import AsyncSessionLocal
 from app.core.tokens import decode_access_token
 from app.models.user import User
+from app.services.user_cache import cache_user, get_cached_user
 
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 bearer_scheme = HTTPBearer()
 
 
-def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# Requests beyond the pool wait here in FIFO order; waiting inside the pool lets
+# newcomers grab freed connections first and starves a few requests for seconds
+_db_slots = asyncio.Semaphore(settings.db_pool_size + settings.db_max_overflow)
+
 
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with _db_slots:
+        db = AsyncSessionLocal()
+        try:
+            yield db
+        finally:
+            await db.close()
 
-def get_current_user(
-        db: Session = Depends(get_db),
+
+async def get_current_user(
+        db: AsyncSession = Depends(get_db),
         credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
 ) -> User:
     try:
@@ -30,10 +40,15 @@ def get_current_user(
         if not user_id:
             raise ValueError("Missing subject")
 
-        user = db.query(User).filter(User.id == int(user_id)).first()
+        user = get_cached_user(int(user_id))
+        if user:
+            return user
+
+        user = await db.scalar(select(User).where(User.id == int(user_id)))
         if not user:
             raise ValueError("User not found")
 
+        cache_user(user)
         return user
     except Exception:
         raise HTTPException(
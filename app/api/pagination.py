@@ -0,0 +1,45 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, Response, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+# Opaque keyset cursor: urlsafe base64 of a JSON array of the sort-key values
+def encode_cursor(*values) -> str:
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("Cursor shape mismatch")
+
+        return tuple(
+            datetime.fromisoformat(v) if t is datetime else t(v)
+            for v, t in zip(values, types)
+        )
+    except (ValueError, TypeError, binascii.Error, UnicodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+# items were fetched with limit + 1 so a following page can be detected without a count.
+# key=None trims the page without emitting a cursor (e.g. ranked results).
+def page_with_cursor(response: Response, items: list, limit: int, key) -> list:
+    if len(items) > limit:
+        items = items[:limit]
+        if key is not None:
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*key(items[-1]))
+    return items
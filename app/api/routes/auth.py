@@ -1,43 +1,51 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas.auth import RegisterRequest, RegisterResponse
 from app.api.deps import get_db
-from app.core.security import hash_password
+from app.core.security import PasswordHashingBusy, hash_password
 from app.models.user import User
 from app.api.deps import get_current_user
 from app.api.schemas.auth import UserResponse
 
 from app.api.schemas.login import LoginRequest, TokenResponse
-from app.core.security import verify_password
+from app.core.security import needs_rehash, verify_password
 from app.core.tokens import create_access_token
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many concurrent logins, retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post(
     "/register",
     response_model=RegisterResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def register(
+async def register(
         payload: RegisterRequest,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
 ) -> RegisterResponse:
     # 1) Prüfen, ob Email schon existiert
-    existing_user = (
-        db.query(User)
-        .filter(User.email == str(payload.email))
-        .first()
-    )
+    existing_user = await db.scalar(select(User).where(User.email == str(payload.email)))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already registered",
         )
 
-    # 2) Passwort hashen
-    password_hash = hash_password(payload.password)
+    # 2) Passwort hashen (im Prozesspool, 503 wenn ausgelastet)
+    try:
+        password_hash = await hash_password(payload.password)
+    except PasswordHashingBusy:
+        raise hashing_busy()
 
     # 3) User erstellen
     user = User(
@@ -47,8 +55,8 @@ def register(
 
     # 4) In DB speichern
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     # 5) Response
     return RegisterResponse(
@@ -62,18 +70,31 @@ def register(
     response_model=TokenResponse,
     status_code=status.HTTP_200_OK,
 )
-def login(
+async def login(
         payload: LoginRequest,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
 ) -> TokenResponse:
-    user = db.query(User).filter(User.email == str(payload.email)).first()
+    user = await db.scalar(select(User).where(User.email == str(payload.email)))
+
+    try:
+        valid = user is not None and await verify_password(payload.password, str(user.password_hash))
+    except PasswordHashingBusy:
+        raise hashing_busy()
 
-    if not user or not verify_password(payload.password, str(user.password_hash)):
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
 
+    # Upgrade hashes created with older Argon2 parameters; best effort, login succeeds anyway
+    if needs_rehash(user.password_hash):
+        try:
+            user.password_hash = await hash_password(payload.password)
+            await db.commit()
+        except PasswordHashingBusy:
+            pass
+
     access_token = create_access_token(subject=str(user.id))
     return TokenResponse(access_token=access_token)
 
@@ -83,5 +104,5 @@ def login(
     response_model=UserResponse,
     status_code=status.HTTP_200_OK,
 )
-def me(current_user: User = Depends(get_current_user)) -> UserResponse:
+async def me(current_user: User = Depends(get_current_user)) -> UserResponse:
     return UserResponse(id=current_user.id, email=current_user.email)
@@ -1,56 +1,143 @@
-from fastapi import APIRouter, Depends, Query, Response, status
-from sqlalchemy.orm import Session
+import bisect
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.api.deps import get_db
-from app.api.schemas.exercise_template import ExerciseTemplateResponse
-from app.models.exercise_template import ExerciseTemplate
+from app.api.pagination import decode_cursor, page_with_cursor
+from app.api.search import (
+    fulltext_match,
+    fulltext_query,
+    fulltext_rank,
+    fuzzy_match,
+    fuzzy_rank,
+    reject_cursor_for_ranked_search,
+)
+from app.api.schemas.exercise_template import (
+    ExerciseTemplateDetailResponse,
+    ExerciseTemplateResponse,
+)
+from app.core.config import settings
+from app.models.exercise_template import LIST_COLUMNS, ExerciseTemplate
+from app.services.template_catalog import cached_count, count_key, get_catalog_async
 
 router = APIRouter(prefix="/exercise-templates", tags=["exercise-templates"])
 
 
 @router.get("", response_model=list[ExerciseTemplateResponse], status_code=status.HTTP_200_OK)
-def list_templates(
+async def list_templates(
         response: Response,
-        db: Session = Depends(get_db),
-        q: str | None = Query(default=None, description="Search by name (contains)"),
+        db: AsyncSession = Depends(get_db),
+        q: str | None = Query(default=None, description="Search by name"),
+        match: Literal["contains", "fuzzy"] = Query(
+            default="contains",
+            description="fuzzy = typo tolerant, ranked by similarity",
+        ),
+        search: str | None = Query(
+            default=None,
+            description="Full-text search over name, muscles and instructions (ranked)",
+        ),
         category: str | None = Query(default=None),
         equipment: str | None = Query(default=None),
         tracking_type: str | None = Query(default=None),
-        muscle: str | None = Query(default=None, description="Matches primary/secondary muscles"),
+        level: str | None = Query(default=None),
+        force: str | None = Query(default=None),
+        mechanic: str | None = Query(default=None),
+        muscle: list[str] | None = Query(
+            default=None,
+            description="Matches primary/secondary muscles; repeat for several",
+        ),
+        muscle_match: Literal["any", "all"] = Query(default="any"),
         limit: int = Query(default=50, ge=1, le=200),
-        offset: int = Query(default=0, ge=0),
+        after: str | None = Query(default=None, description="Cursor from X-Next-Cursor"),
+        offset: int = Query(default=0, ge=0, deprecated=True),
+        include_total: bool = Query(default=True, description="false skips X-Total-Count"),
 ) -> list[ExerciseTemplateResponse]:
-    query = db.query(ExerciseTemplate)
+    ranked = bool(search) or (bool(q) and match == "fuzzy")
+    filters = {
+        "category": category,
+        "equipment": equipment,
+        "tracking_type": tracking_type,
+        "level": level,
+        "force": force,
+        "mechanic": mechanic,
+    }
+
+    catalog = await get_catalog_async(db)
+
+    if not ranked:
+        # Plain filters/substring: answered from the in-memory catalog
+        positions = catalog.filter(q=q, muscles=muscle, muscle_match=muscle_match, **filters)
+        if include_total:
+            response.headers["X-Total-Count"] = str(len(positions))
+
+        if after:
+            last_name, last_id = decode_cursor(after, str, int)
+            start = bisect.bisect_left(positions, catalog.position_after(last_name, last_id))
+        else:
+            start = offset
 
-    if q:
-        query = query.filter(ExerciseTemplate.name.ilike(f"%{q}%"))
+        page = [catalog.entries[p].response for p in positions[start:start + limit + 1]]
+        return page_with_cursor(response, page, limit, lambda t: (t.name, t.id))
 
-    if category:
-        query = query.filter(ExerciseTemplate.category == category.lower())
+    # Ranked search needs pg_trgm / tsvector, so it stays in Postgres
+    conditions = []
+    order_by = [ExerciseTemplate.name.asc(), ExerciseTemplate.id.asc()]
 
-    if equipment:
-        query = query.filter(ExerciseTemplate.equipment == equipment.lower())
+    if q and match == "fuzzy":
+        reject_cursor_for_ranked_search(after)
+        conditions.append(fuzzy_match(ExerciseTemplate.name, q))
+        order_by.insert(0, fuzzy_rank(ExerciseTemplate.name, q).desc())
+    elif q:
+        conditions.append(ExerciseTemplate.name.ilike(f"%{q}%"))
 
-    if tracking_type:
-        query = query.filter(ExerciseTemplate.tracking_type == tracking_type.lower())
+    if search:
+        reject_cursor_for_ranked_search(after)
+        tsquery = fulltext_query(search)
+        conditions.append(fulltext_match(ExerciseTemplate.search_vector, tsquery))
+        order_by.insert(0, fulltext_rank(ExerciseTemplate.search_vector, tsquery).desc())
+
+    for field, value in filters.items():
+        if value:
+            conditions.append(getattr(ExerciseTemplate, field) == value.lower())
 
     if muscle:
-        m = muscle.lower()
-        # JSONB contains: list contains the string
-        query = query.filter(
-            (ExerciseTemplate.primary_muscles.contains([m]))
-            | (ExerciseTemplate.secondary_muscles.contains([m]))
-        )
+        # JSONB contains per muscle and column -> each predicate is a GIN index probe
+        per_muscle = [
+            or_(
+                ExerciseTemplate.primary_muscles.contains([m]),
+                ExerciseTemplate.secondary_muscles.contains([m]),
+            )
+            for m in sorted({m.lower() for m in muscle})
+        ]
+        conditions.append(or_(*per_muscle) if muscle_match == "any" else and_(*per_muscle))
 
-    total = query.count()
-    response.headers["X-Total-Count"] = str(total)
+    if include_total:
+        key = count_key(
+            q=q, match=match, search=search, muscles=muscle, muscle_match=muscle_match, **filters
+        )
+        # Plain count(*) over the filters instead of counting a subquery of full rows
+        total = await cached_count(
+            catalog,
+            key,
+            lambda: db.scalar(select(func.count()).select_from(ExerciseTemplate).where(*conditions)),
+        )
+        response.headers["X-Total-Count"] = str(total)
 
     items = (
-        query.order_by(ExerciseTemplate.name.asc())
-        .limit(limit)
-        .offset(offset)
-        .all()
-    )
+        await db.scalars(
+            select(ExerciseTemplate)
+            .options(load_only(*(getattr(ExerciseTemplate, c) for c in LIST_COLUMNS)))
+            .where(*conditions)
+            .order_by(*order_by)
+            .limit(limit + 1)
+            .offset(offset)
+        )
+    ).all()
+    items = page_with_cursor(response, items, limit, None)
 
     return [
         ExerciseTemplateResponse(
@@ -64,3 +151,40 @@ def list_templates(
         )
         for t in items
     ]
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+@router.get(
+    "/{template_ref}",
+    response_model=ExerciseTemplateDetailResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_template(
+        template_ref: str,
+        db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None),
+) -> Response:
+    # template_ref is the numeric id or the slug; body bytes come pre-serialized from the catalog
+    detail = (await get_catalog_async(db)).detail(template_ref)
+    if detail is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Template not found",
+        )
+
+    headers = {
+        "ETag": detail.etag,
+        "Cache-Control": f"public, max-age={settings.template_detail_max_age_seconds}",
+    }
+    if _etag_matches(if_none_match, detail.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=detail.body, media_type="application/json", headers=headers)
@@ -1,14 +1,29 @@
 import re
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.api.deps import get_current_user, get_db
-from app.api.schemas.exercise import ExerciseCreateRequest, ExerciseResponse
-from app.models.exercise import Exercise
+from app.api.pagination import decode_cursor, page_with_cursor
+from app.api.search import fuzzy_match, fuzzy_rank, reject_cursor_for_ranked_search
+from app.api.schemas.exercise import (
+    ExerciseCreateRequest,
+    ExerciseFromTemplatesRequest,
+    ExerciseFromTemplatesResponse,
+    ExerciseResponse,
+    SkippedTemplateItem,
+)
+from app.models.exercise import NAME_CONSTRAINT, Exercise
 from app.models.user import User
 from app.models.exercise_template import ExerciseTemplate
 from app.api.schemas.exercise import ExerciseUpdateRequest
+from app.services.overview import invalidate_overview
+from app.services.personal_records import refresh_exercise_record
 
 router = APIRouter(prefix="/exercises", tags=["exercises"])
 
@@ -19,40 +34,73 @@ def normalize_name(name: str) -> str:
     return value
 
 
-@router.post("", response_model=ExerciseResponse, status_code=status.HTTP_201_CREATED)
-def create_exercise(
-        payload: ExerciseCreateRequest,
-        db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user),
-) -> ExerciseResponse:
-    normalized = normalize_name(payload.name)
+RESPONSE_COLUMNS = (
+    Exercise.id,
+    Exercise.template_id,
+    Exercise.name,
+    Exercise.muscle_group,
+    Exercise.equipment,
+    Exercise.category,
+    Exercise.tracking_type,
+)
 
-    exists = (
-        db.query(Exercise)
-        .filter(Exercise.user_id == current_user.id)
-        .filter(Exercise.name_normalized == normalized)
-        .first()
-    )
-    if exists:
+
+def is_name_conflict(err: IntegrityError) -> bool:
+    return getattr(getattr(err.orig, "diag", None), "constraint_name", None) == NAME_CONSTRAINT
+
+
+def exercise_values_from_template(template: ExerciseTemplate, user_id: int) -> dict:
+    return {
+        "user_id": user_id,
+        "template_id": template.id,
+        "name": template.name,
+        "name_normalized": normalize_name(template.name),
+        # We keep a single muscle_group string in user exercises for MVP:
+        "muscle_group": template.primary_muscles[0] if template.primary_muscles else "unknown",
+        "equipment": template.equipment,
+        "category": template.category,
+        "tracking_type": template.tracking_type,
+    }
+
+
+# One INSERT ... ON CONFLICT DO NOTHING RETURNING; no row back means the name is taken
+async def insert_exercise(db: AsyncSession, values: dict):
+    row = (
+        await db.execute(
+            pg_insert(Exercise)
+            .values(values)
+            .on_conflict_do_nothing(constraint=NAME_CONSTRAINT)
+            .returning(*RESPONSE_COLUMNS)
+        )
+    ).first()
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Exercise already exists",
         )
+    return row
 
-    ex = Exercise(
-        user_id=current_user.id,
-        template_id=None,
-        name=payload.name,
-        name_normalized=normalized,
-        muscle_group=payload.muscle_group.lower(),
-        equipment=payload.equipment.lower(),
-        category=payload.category.lower(),
-        tracking_type=payload.tracking_type.lower(),
-    )
 
-    db.add(ex)
-    db.commit()
-    db.refresh(ex)
+@router.post("", response_model=ExerciseResponse, status_code=status.HTTP_201_CREATED)
+async def create_exercise(
+        payload: ExerciseCreateRequest,
+        db: AsyncSession = Depends(get_db),
+        current_user: User = Depends(get_current_user),
+) -> ExerciseResponse:
+    ex = await insert_exercise(
+        db,
+        {
+            "user_id": current_user.id,
+            "template_id": None,
+            "name": payload.name,
+            "name_normalized": normalize_name(payload.name),
+            "muscle_group": payload.muscle_group.lower(),
+            "equipment": payload.equipment.lower(),
+            "category": payload.category.lower(),
+            "tracking_type": payload.tracking_type.lower(),
+        },
+    )
+    await db.commit()
 
     return ExerciseResponse(
         id=ex.id,
@@ -66,25 +114,46 @@ def create_exercise(
 
 
 @router.get("", response_model=list[ExerciseResponse], status_code=status.HTTP_200_OK)
-def list_exercises(
-        db: Session = Depends(get_db),
+async def list_exercises(
+        response: Response,
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
         q: str | None = Query(default=None),
+        match: Literal["contains", "fuzzy"] = Query(
+            default="contains",
+            description="fuzzy = typo tolerant, ranked by similarity",
+        ),
         limit: int = Query(default=50, ge=1, le=200),
-        offset: int = Query(default=0, ge=0),
+        after: str | None = Query(default=None, description="Cursor from X-Next-Cursor"),
+        offset: int = Query(default=0, ge=0, deprecated=True),
 ) -> list[ExerciseResponse]:
-    query = db.query(Exercise).filter(Exercise.user_id == current_user.id)
+    query = select(Exercise).where(Exercise.user_id == current_user.id)
+    order_by = [Exercise.name.asc(), Exercise.id.asc()]
 
-    if q:
+    if q and match == "fuzzy":
+        reject_cursor_for_ranked_search(after)
         qn = normalize_name(q)
-        query = query.filter(Exercise.name_normalized.ilike(f"%{qn}%"))
+        query = query.where(fuzzy_match(Exercise.name_normalized, qn))
+        order_by.insert(0, fuzzy_rank(Exercise.name_normalized, qn).desc())
+    elif q:
+        qn = normalize_name(q)
+        query = query.where(Exercise.name_normalized.ilike(f"%{qn}%"))
+
+    if after:
+        last_name, last_id = decode_cursor(after, str, int)
+        query = query.where(tuple_(Exercise.name, Exercise.id) > tuple_(last_name, last_id))
+        # Deprecated offset paging is ignored once a cursor is given
+        offset = 0
 
     items = (
-        query.order_by(Exercise.name.asc())
-        .limit(limit)
-        .offset(offset)
-        .all()
-    )
+        await db.scalars(
+            query.order_by(*order_by)
+            .limit(limit + 1)
+            .offset(offset)
+        )
+    ).all()
+    ranked = bool(q) and match == "fuzzy"
+    items = page_with_cursor(response, items, limit, None if ranked else lambda e: (e.name, e.id))
 
     return [
         ExerciseResponse(
@@ -105,49 +174,20 @@ def list_exercises(
     response_model=ExerciseResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_exercise_from_template(
+async def create_exercise_from_template(
         template_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> ExerciseResponse:
-    template = db.query(ExerciseTemplate).filter(ExerciseTemplate.id == template_id).first()
+    template = await db.get(ExerciseTemplate, template_id)
     if not template:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Template not found",
         )
 
-    normalized = normalize_name(template.name)
-
-    exists = (
-        db.query(Exercise)
-        .filter(Exercise.user_id == current_user.id)
-        .filter(Exercise.name_normalized == normalized)
-        .first()
-    )
-    if exists:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Exercise already exists",
-        )
-
-    # We keep a single muscle_group string in user exercises for MVP:
-    muscle_group = (template.primary_muscles[0] if template.primary_muscles else "unknown")
-
-    ex = Exercise(
-        user_id=current_user.id,
-        template_id=template.id,
-        name=template.name,
-        name_normalized=normalized,
-        muscle_group=muscle_group,
-        equipment=template.equipment,
-        category=template.category,
-        tracking_type=template.tracking_type,
-    )
-
-    db.add(ex)
-    db.commit()
-    db.refresh(ex)
+    ex = await insert_exercise(db, exercise_values_from_template(template, current_user.id))
+    await db.commit()
 
     return ExerciseResponse(
         id=ex.id,
@@ -160,22 +200,115 @@ def create_exercise_from_template(
     )
 
 
+@router.post(
+    "/from-templates",
+    response_model=ExerciseFromTemplatesResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def create_exercises_from_templates(
+        payload: ExerciseFromTemplatesRequest,
+        db: AsyncSession = Depends(get_db),
+        current_user: User = Depends(get_current_user),
+) -> ExerciseFromTemplatesResponse:
+    # Keep request order, drop repeated ids
+    template_ids = list(dict.fromkeys(payload.template_ids))
+
+    # All templates in one query
+    templates = {
+        t.id: t
+        for t in await db.scalars(
+            select(ExerciseTemplate)
+            .options(
+                load_only(
+                    ExerciseTemplate.id,
+                    ExerciseTemplate.name,
+                    ExerciseTemplate.equipment,
+                    ExerciseTemplate.category,
+                    ExerciseTemplate.tracking_type,
+                    ExerciseTemplate.primary_muscles,
+                )
+            )
+            .where(ExerciseTemplate.id.in_(template_ids))
+        )
+    }
+
+    # All name collisions in one query
+    normalized = {t.id: normalize_name(t.name) for t in templates.values()}
+    taken = set(
+        await db.scalars(
+            select(Exercise.name_normalized)
+            .where(Exercise.user_id == current_user.id)
+            .where(Exercise.name_normalized.in_(set(normalized.values())))
+        )
+    )
+
+    values = []
+    skipped = []
+    for template_id in template_ids:
+        template = templates.get(template_id)
+        if template is None:
+            skipped.append(SkippedTemplateItem(template_id=template_id, reason="template_not_found"))
+            continue
+        # Also catches two requested templates that normalize to the same name
+        if normalized[template_id] in taken:
+            skipped.append(SkippedTemplateItem(template_id=template_id, reason="exercise_exists"))
+            continue
+
+        taken.add(normalized[template_id])
+        values.append(exercise_values_from_template(template, current_user.id))
+
+    created = []
+    if values:
+        # Single multi-row INSERT ... RETURNING; names created concurrently are skipped by the constraint
+        created = (
+            await db.execute(
+                pg_insert(Exercise)
+                .values(values)
+                .on_conflict_do_nothing(constraint=NAME_CONSTRAINT)
+                .returning(*RESPONSE_COLUMNS)
+            )
+        ).all()
+        await db.commit()
+
+        inserted = {e.template_id for e in created}
+        skipped.extend(
+            SkippedTemplateItem(template_id=v["template_id"], reason="exercise_exists")
+            for v in values
+            if v["template_id"] not in inserted
+        )
+
+    return ExerciseFromTemplatesResponse(
+        created=[
+            ExerciseResponse(
+                id=e.id,
+                template_id=e.template_id,
+                name=e.name,
+                muscle_group=e.muscle_group,
+                equipment=e.equipment,
+                category=e.category,
+                tracking_type=e.tracking_type,
+            )
+            for e in created
+        ],
+        skipped=skipped,
+    )
+
+
 @router.put(
     "/{exercise_id}",
     response_model=ExerciseResponse,
     status_code=status.HTTP_200_OK,
 )
-def update_exercise(
+async def update_exercise(
         exercise_id: int,
         payload: ExerciseUpdateRequest,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> ExerciseResponse:
-    ex = (
-        db.query(Exercise)
-        .filter(Exercise.id == exercise_id)
-        .filter(Exercise.user_id == current_user.id)
-        .first()
+    ex = await db.scalar(
+        select(Exercise)
+        .where(Exercise.id == exercise_id)
+        .where(Exercise.user_id == current_user.id)
     )
     if not ex:
         raise HTTPException(
@@ -183,23 +316,20 @@ def update_exercise(
             detail="Exercise not found",
         )
 
-    # Name update + collision check
+    # Name update; collisions are rejected by the unique constraint
     if payload.name is not None:
-        normalized = normalize_name(payload.name)
-        collision = (
-            db.query(Exercise)
-            .filter(Exercise.user_id == current_user.id)
-            .filter(Exercise.name_normalized == normalized)
-            .filter(Exercise.id != ex.id)
-            .first()
-        )
-        if collision:
+        ex.name = payload.name
+        ex.name_normalized = normalize_name(payload.name)
+        try:
+            await db.flush()
+        except IntegrityError as err:
+            await db.rollback()
+            if not is_name_conflict(err):
+                raise
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Exercise name already exists",
             )
-        ex.name = payload.name
-        ex.name_normalized = normalized
 
     if payload.muscle_group is not None:
         ex.muscle_group = payload.muscle_group.lower()
@@ -210,11 +340,15 @@ def update_exercise(
     if payload.category is not None:
         ex.category = payload.category.lower()
 
-    if payload.tracking_type is not None:
+    if payload.tracking_type is not None and payload.tracking_type.lower() != ex.tracking_type:
         ex.tracking_type = payload.tracking_type.lower()
+        await db.flush()
+        await db.run_sync(refresh_exercise_record, ex.id)
 
-    db.commit()
-    db.refresh(ex)
+    await db.commit()
+    await db.refresh(ex)
+    # Overview shows exercise names
+    invalidate_overview(current_user.id)
 
     return ExerciseResponse(
         id=ex.id,
@@ -231,16 +365,15 @@ def update_exercise(
     "/{exercise_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_exercise(
+async def delete_exercise(
         exercise_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> None:
-    ex = (
-        db.query(Exercise)
-        .filter(Exercise.id == exercise_id)
-        .filter(Exercise.user_id == current_user.id)
-        .first()
+    ex = await db.scalar(
+        select(Exercise)
+        .where(Exercise.id == exercise_id)
+        .where(Exercise.user_id == current_user.id)
     )
     if not ex:
         raise HTTPException(
@@ -248,6 +381,7 @@ def delete_exercise(
             detail="Exercise not found",
         )
 
-    db.delete(ex)
-    db.commit()
+    await db.delete(ex)
+    await db.commit()
+    invalidate_overview(current_user.id)
     return None
@@ -1,102 +1,32 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
 from app.api.schemas.progress import ExercisePRResponse
 from app.models.exercise import Exercise
 from app.models.user import User
-from app.models.workout_set import WorkoutSet
 from app.api.schemas.progress_history import ExerciseHistoryResponse, ProgressPoint
-from app.models.workout import Workout
-from datetime import datetime, timedelta, timezone
-from sqlalchemy import func
-from app.api.schemas.progress_overview import ProgressOverviewResponse, TopExerciseItem
+from datetime import datetime, timezone
+from app.api.schemas.progress_overview import ProgressOverviewResponse
+from app.api.schemas.progress_strength import ExerciseStrengthResponse, StrengthPoint
+from app.services.downsample import lttb
+from app.services.history import history_points
+from app.services.overview import get_overview
+from app.services.personal_records import get_personal_records
+from app.services.strength import compute_strength_series, load_strength_columns
 
 router = APIRouter(prefix="/progress", tags=["progress"])
 
 
 @router.get("/prs", response_model=list[ExercisePRResponse], status_code=status.HTTP_200_OK)
-def list_personal_records(
-        db: Session = Depends(get_db),
+async def list_personal_records(
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> list[ExercisePRResponse]:
-    # Load all user exercises
-    exercises = (
-        db.query(Exercise)
-        .filter(Exercise.user_id == current_user.id)
-        .order_by(Exercise.name.asc())
-        .all()
-    )
-
-    results: list[ExercisePRResponse] = []
-
-    for ex in exercises:
-        sets = (
-            db.query(WorkoutSet)
-            .filter(WorkoutSet.exercise_id == ex.id)
-            .all()
-        )
-
-        if not sets:
-            results.append(
-                ExercisePRResponse(
-                    exercise_id=ex.id,
-                    exercise_name=ex.name,
-                    tracking_type=ex.tracking_type,
-                )
-            )
-            continue
-
-        if ex.tracking_type == "weight_reps":
-            best = None
-            for s in sets:
-                if s.weight_kg is None:
-                    continue
-                if best is None or s.weight_kg > best.weight_kg:
-                    best = s
-            results.append(
-                ExercisePRResponse(
-                    exercise_id=ex.id,
-                    exercise_name=ex.name,
-                    tracking_type=ex.tracking_type,
-                    best_weight_kg=float(best.weight_kg) if best and best.weight_kg is not None else None,
-                    best_reps=best.reps if best else None,
-                )
-            )
-
-        elif ex.tracking_type == "time":
-            best_seconds = max((s.duration_seconds or 0) for s in sets)
-            results.append(
-                ExercisePRResponse(
-                    exercise_id=ex.id,
-                    exercise_name=ex.name,
-                    tracking_type=ex.tracking_type,
-                    best_duration_seconds=best_seconds if best_seconds > 0 else None,
-                )
-            )
-
-        elif ex.tracking_type == "distance":
-            best_meters = max((s.distance_meters or 0) for s in sets)
-            results.append(
-                ExercisePRResponse(
-                    exercise_id=ex.id,
-                    exercise_name=ex.name,
-                    tracking_type=ex.tracking_type,
-                    best_distance_meters=best_meters if best_meters > 0 else None,
-                )
-            )
-
-        else:
-            # unknown tracking type -> return empty PR values
-            results.append(
-                ExercisePRResponse(
-                    exercise_id=ex.id,
-                    exercise_name=ex.name,
-                    tracking_type=ex.tracking_type,
-                )
-            )
-
-    return results
+    return await db.run_sync(get_personal_records, current_user.id)
 
 
 @router.get(
@@ -104,143 +34,116 @@ def list_personal_records(
     response_model=ExerciseHistoryResponse,
     status_code=status.HTTP_200_OK,
 )
-def exercise_history(
+async def exercise_history(
         exercise_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
+        date_from: datetime | None = Query(default=None, alias="from"),
+        date_to: datetime | None = Query(default=None, alias="to"),
+        bucket: Literal["workout", "day", "week", "month"] = Query(default="workout"),
+        metric: Literal["max", "sum"] = Query(
+            default="max",
+            description="Per-bucket best value or total (volume for weight_reps)",
+        ),
+        max_points: int | None = Query(default=None, ge=3, le=5000),
 ) -> ExerciseHistoryResponse:
-    ex = (
-        db.query(Exercise)
-        .filter(Exercise.id == exercise_id)
-        .filter(Exercise.user_id == current_user.id)
-        .first()
+    ex = await db.scalar(
+        select(Exercise)
+        .where(Exercise.id == exercise_id)
+        .where(Exercise.user_id == current_user.id)
     )
     if not ex:
-        from fastapi import HTTPException
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
 
-    # Join WorkoutSet -> Workout to get a timestamp (started_at)
-    rows = (
-        db.query(WorkoutSet, Workout)
-        .join(Workout, Workout.id == WorkoutSet.workout_id)
-        .filter(WorkoutSet.exercise_id == ex.id)
-        .filter(Workout.user_id == current_user.id)
-        .order_by(Workout.started_at.asc(), WorkoutSet.set_number.asc(), WorkoutSet.id.asc())
-        .all()
+    rows = await db.run_sync(
+        history_points, ex, bucket=bucket, metric=metric, date_from=date_from, date_to=date_to
     )
 
-    points: list[ProgressPoint] = []
-
-    # workout_id -> best_value + timestamp
-    best_by_workout: dict[int, tuple[float, object]] = {}
-
-    for s, w in rows:
-        if ex.tracking_type == "weight_reps":
-            if s.weight_kg is None or s.reps is None:
-                continue
-            value = float(s.weight_kg) * float(s.reps)
-
-        elif ex.tracking_type == "time":
-            if s.duration_seconds is None:
-                continue
-            value = float(s.duration_seconds)
-
-        elif ex.tracking_type == "distance":
-            if s.distance_meters is None:
-                continue
-            value = float(s.distance_meters)
-
-        else:
-            continue
-
-        current = best_by_workout.get(w.id)
-        if current is None or value > current[0]:
-            best_by_workout[w.id] = (value, w.started_at)
-
-    # Convert to list of points, sorted by time
-    for _, (value, ts) in sorted(best_by_workout.items(), key=lambda x: x[1][1]):
-        points.append(ProgressPoint(timestamp=ts, value=value))
+    # Downsample long series so charts never receive more than max_points
+    if max_points is not None and len(rows) > max_points:
+        rows = lttb(
+            rows,
+            [ts.timestamp() for ts, _ in rows],
+            [value for _, value in rows],
+            max_points,
+        )
 
     return ExerciseHistoryResponse(
         exercise_id=ex.id,
         exercise_name=ex.name,
         tracking_type=ex.tracking_type,
-        points=points,
+        bucket=bucket,
+        metric=metric,
+        points=[ProgressPoint(timestamp=ts, value=value) for ts, value in rows],
     )
 
 
 @router.get(
-    "/overview",
-    response_model=ProgressOverviewResponse,
+    "/exercises/{exercise_id}/strength",
+    response_model=ExerciseStrengthResponse,
     status_code=status.HTTP_200_OK,
 )
-def overview(
-        db: Session = Depends(get_db),
+async def exercise_strength(
+        exercise_id: int,
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
-) -> ProgressOverviewResponse:
-    now = datetime.now(tz=timezone.utc)
-
-    # Start of week (Monday 00:00) in UTC
-    start_of_week = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=now.weekday())
-
-    # Workouts this week
-    workouts_this_week = (
-                             db.query(func.count(Workout.id))
-                             .filter(Workout.user_id == current_user.id)
-                             .filter(Workout.started_at >= start_of_week)
-                             .filter(Workout.started_at <= now)
-                             .scalar()
-                         ) or 0
-
-    # Sets this week (join sets -> workouts in range)
-    sets_this_week = (
-                         db.query(func.count(WorkoutSet.id))
-                         .join(Workout, Workout.id == WorkoutSet.workout_id)
-                         .filter(Workout.user_id == current_user.id)
-                         .filter(Workout.started_at >= start_of_week)
-                         .filter(Workout.started_at <= now)
-                         .scalar()
-                     ) or 0
-
-    # Top exercises this week by number of sets
-    rows = (
-        db.query(
-            WorkoutSet.exercise_id,
-            func.count(WorkoutSet.id).label("sets_count"),
-        )
-        .join(Workout, Workout.id == WorkoutSet.workout_id)
-        .filter(Workout.user_id == current_user.id)
-        .filter(Workout.started_at >= start_of_week)
-        .filter(Workout.started_at <= now)
-        .group_by(WorkoutSet.exercise_id)
-        .order_by(func.count(WorkoutSet.id).desc())
-        .limit(5)
-        .all()
+        formula: Literal["epley", "brzycki"] = Query(default="epley"),
+        window_days: int = Query(default=28, ge=1, le=365, description="Rolling volume window"),
+) -> ExerciseStrengthResponse:
+    ex = await db.scalar(
+        select(Exercise)
+        .where(Exercise.id == exercise_id)
+        .where(Exercise.user_id == current_user.id)
     )
+    if not ex:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
 
-    # Map exercise_id -> name
-    exercise_ids = [r.exercise_id for r in rows]
-    name_map = {}
-    if exercise_ids:
-        ex_rows = (
-            db.query(Exercise.id, Exercise.name)
-            .filter(Exercise.user_id == current_user.id)
-            .filter(Exercise.id.in_(exercise_ids))
-            .all()
+    if ex.tracking_type != "weight_reps":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Strength analytics require weight_reps tracking",
         )
-        name_map = {eid: name for eid, name in ex_rows}
 
-    top = [
-        TopExerciseItem(
-            exercise_id=r.exercise_id,
-            exercise_name=name_map.get(r.exercise_id, "Unknown"),
-            sets_count=int(r.sets_count),
+    series = compute_strength_series(
+        await db.run_sync(load_strength_columns, ex),
+        formula=formula,
+        window_days=window_days,
+    )
+
+    points = [
+        StrengthPoint(
+            timestamp=datetime.fromtimestamp(epoch, tz=timezone.utc),
+            best_e1rm_kg=round(best, 2),
+            volume_kg=round(volume, 2),
+            rolling_volume_kg=round(rolling, 2),
+            relative_intensity=round(intensity, 4),
+        )
+        for epoch, best, volume, rolling, intensity in zip(
+            series.epochs.tolist(),
+            series.best_e1rm.tolist(),
+            series.volume.tolist(),
+            series.rolling_volume.tolist(),
+            series.relative_intensity.tolist(),
         )
-        for r in rows
     ]
 
-    return ProgressOverviewResponse(
-        workouts_this_week=int(workouts_this_week),
-        sets_this_week=int(sets_this_week),
-        top_exercises_this_week=top,
+    return ExerciseStrengthResponse(
+        exercise_id=ex.id,
+        exercise_name=ex.name,
+        formula=formula,
+        window_days=window_days,
+        estimated_1rm_kg=round(float(series.best_e1rm.max()), 2) if series.best_e1rm.size else None,
+        points=points,
     )
+
+
+@router.get(
+    "/overview",
+    response_model=ProgressOverviewResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def overview(
+        db: AsyncSession = Depends(get_db),
+        current_user: User = Depends(get_current_user),
+) -> ProgressOverviewResponse:
+    return await db.run_sync(get_overview, current_user.id)
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
 from app.api.schemas.workout_plan import (
@@ -20,53 +21,54 @@ router = APIRouter(prefix="/plans", tags=["plans"])
 
 
 @router.post("", response_model=WorkoutPlanResponse, status_code=status.HTTP_201_CREATED)
-def create_plan(
+async def create_plan(
         payload: WorkoutPlanCreateRequest,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> WorkoutPlanResponse:
     plan = WorkoutPlan(user_id=current_user.id, name=payload.name)
     db.add(plan)
-    db.commit()
-    db.refresh(plan)
+    await db.commit()
+    await db.refresh(plan)
     return WorkoutPlanResponse(id=plan.id, name=plan.name)
 
 
 @router.get("", response_model=list[WorkoutPlanResponse], status_code=status.HTTP_200_OK)
-def list_plans(
-        db: Session = Depends(get_db),
+async def list_plans(
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> list[WorkoutPlanResponse]:
     plans = (
-        db.query(WorkoutPlan)
-        .filter(WorkoutPlan.user_id == current_user.id)
-        .order_by(WorkoutPlan.id.desc())
-        .all()
-    )
+        await db.scalars(
+            select(WorkoutPlan)
+            .where(WorkoutPlan.user_id == current_user.id)
+            .order_by(WorkoutPlan.id.desc())
+        )
+    ).all()
     return [WorkoutPlanResponse(id=p.id, name=p.name) for p in plans]
 
 
 @router.get("/{plan_id}", response_model=WorkoutPlanDetailResponse, status_code=status.HTTP_200_OK)
-def get_plan(
+async def get_plan(
         plan_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> WorkoutPlanDetailResponse:
-    plan = (
-        db.query(WorkoutPlan)
-        .filter(WorkoutPlan.id == plan_id)
-        .filter(WorkoutPlan.user_id == current_user.id)
-        .first()
+    plan = await db.scalar(
+        select(WorkoutPlan)
+        .where(WorkoutPlan.id == plan_id)
+        .where(WorkoutPlan.user_id == current_user.id)
     )
     if not plan:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
 
     items = (
-        db.query(WorkoutPlanItem)
-        .filter(WorkoutPlanItem.plan_id == plan.id)
-        .order_by(WorkoutPlanItem.position.asc(), WorkoutPlanItem.id.asc())
-        .all()
-    )
+        await db.scalars(
+            select(WorkoutPlanItem)
+            .where(WorkoutPlanItem.plan_id == plan.id)
+            .order_by(WorkoutPlanItem.position.asc(), WorkoutPlanItem.id.asc())
+        )
+    ).all()
 
     return WorkoutPlanDetailResponse(
         id=plan.id,
@@ -92,26 +94,24 @@ def get_plan(
     response_model=WorkoutPlanItemResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def add_item(
+async def add_item(
         plan_id: int,
         payload: WorkoutPlanItemCreateRequest,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> WorkoutPlanItemResponse:
-    plan = (
-        db.query(WorkoutPlan)
-        .filter(WorkoutPlan.id == plan_id)
-        .filter(WorkoutPlan.user_id == current_user.id)
-        .first()
+    plan = await db.scalar(
+        select(WorkoutPlan)
+        .where(WorkoutPlan.id == plan_id)
+        .where(WorkoutPlan.user_id == current_user.id)
     )
     if not plan:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
 
-    ex = (
-        db.query(Exercise)
-        .filter(Exercise.id == payload.exercise_id)
-        .filter(Exercise.user_id == current_user.id)
-        .first()
+    ex = await db.scalar(
+        select(Exercise)
+        .where(Exercise.id == payload.exercise_id)
+        .where(Exercise.user_id == current_user.id)
     )
     if not ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
@@ -127,8 +127,8 @@ def add_item(
         target_distance_meters=payload.target_distance_meters,
     )
     db.add(item)
-    db.commit()
-    db.refresh(item)
+    await db.commit()
+    await db.refresh(item)
 
     return WorkoutPlanItemResponse(
         id=item.id,
@@ -147,27 +147,25 @@ def add_item(
     response_model=WorkoutPlanItemResponse,
     status_code=status.HTTP_200_OK,
 )
-def update_item(
+async def update_item(
         plan_id: int,
         item_id: int,
         payload: WorkoutPlanItemUpdateRequest,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> WorkoutPlanItemResponse:
-    plan = (
-        db.query(WorkoutPlan)
-        .filter(WorkoutPlan.id == plan_id)
-        .filter(WorkoutPlan.user_id == current_user.id)
-        .first()
+    plan = await db.scalar(
+        select(WorkoutPlan)
+        .where(WorkoutPlan.id == plan_id)
+        .where(WorkoutPlan.user_id == current_user.id)
     )
     if not plan:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
 
-    item = (
-        db.query(WorkoutPlanItem)
-        .filter(WorkoutPlanItem.id == item_id)
-        .filter(WorkoutPlanItem.plan_id == plan.id)
-        .first()
+    item = await db.scalar(
+        select(WorkoutPlanItem)
+        .where(WorkoutPlanItem.id == item_id)
+        .where(WorkoutPlanItem.plan_id == plan.id)
     )
     if not item:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
@@ -187,8 +185,8 @@ def update_item(
     if payload.target_distance_meters is not None:
         item.target_distance_meters = payload.target_distance_meters
 
-    db.commit()
-    db.refresh(item)
+    await db.commit()
+    await db.refresh(item)
 
     return WorkoutPlanItemResponse(
         id=item.id,
@@ -206,17 +204,16 @@ def update_item(
     "/{plan_id}/reorder",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def reorder_items(
+async def reorder_items(
         plan_id: int,
         payload: PlanReorderRequest,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> None:
-    plan = (
-        db.query(WorkoutPlan)
-        .filter(WorkoutPlan.id == plan_id)
-        .filter(WorkoutPlan.user_id == current_user.id)
-        .first()
+    plan = await db.scalar(
+        select(WorkoutPlan)
+        .where(WorkoutPlan.id == plan_id)
+        .where(WorkoutPlan.user_id == current_user.id)
     )
     if not plan:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
@@ -224,11 +221,12 @@ def reorder_items(
     item_ids = [x.item_id for x in payload.items]
 
     items = (
-        db.query(WorkoutPlanItem)
-        .filter(WorkoutPlanItem.plan_id == plan.id)
-        .filter(WorkoutPlanItem.id.in_(item_ids))
-        .all()
-    )
+        await db.scalars(
+            select(WorkoutPlanItem)
+            .where(WorkoutPlanItem.plan_id == plan.id)
+            .where(WorkoutPlanItem.id.in_(item_ids))
+        )
+    ).all()
 
     if len(items) != len(item_ids):
         raise HTTPException(
@@ -241,7 +239,7 @@ def reorder_items(
     for it in items:
         it.position = pos_map[it.id]
 
-    db.commit()
+    await db.commit()
     return None
 
 
@@ -249,32 +247,30 @@ def reorder_items(
     "/{plan_id}/items/{item_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_item(
+async def delete_item(
         plan_id: int,
         item_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> None:
-    plan = (
-        db.query(WorkoutPlan)
-        .filter(WorkoutPlan.id == plan_id)
-        .filter(WorkoutPlan.user_id == current_user.id)
-        .first()
+    plan = await db.scalar(
+        select(WorkoutPlan)
+        .where(WorkoutPlan.id == plan_id)
+        .where(WorkoutPlan.user_id == current_user.id)
     )
     if not plan:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
 
-    item = (
-        db.query(WorkoutPlanItem)
-        .filter(WorkoutPlanItem.id == item_id)
-        .filter(WorkoutPlanItem.plan_id == plan.id)
-        .first()
+    item = await db.scalar(
+        select(WorkoutPlanItem)
+        .where(WorkoutPlanItem.id == item_id)
+        .where(WorkoutPlanItem.plan_id == plan.id)
     )
     if not item:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
 
-    db.delete(item)
-    db.commit()
+    await db.delete(item)
+    await db.commit()
     return None
 
 
@@ -283,34 +279,34 @@ def delete_item(
     response_model=WorkoutPlanResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def duplicate_plan(
+async def duplicate_plan(
         plan_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> WorkoutPlanResponse:
-    plan = (
-        db.query(WorkoutPlan)
-        .filter(WorkoutPlan.id == plan_id)
-        .filter(WorkoutPlan.user_id == current_user.id)
-        .first()
+    plan = await db.scalar(
+        select(WorkoutPlan)
+        .where(WorkoutPlan.id == plan_id)
+        .where(WorkoutPlan.user_id == current_user.id)
     )
     if not plan:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
 
     items = (
-        db.query(WorkoutPlanItem)
-        .filter(WorkoutPlanItem.plan_id == plan.id)
-        .order_by(WorkoutPlanItem.position.asc(), WorkoutPlanItem.id.asc())
-        .all()
-    )
+        await db.scalars(
+            select(WorkoutPlanItem)
+            .where(WorkoutPlanItem.plan_id == plan.id)
+            .order_by(WorkoutPlanItem.position.asc(), WorkoutPlanItem.id.asc())
+        )
+    ).all()
 
     new_plan = WorkoutPlan(
         user_id=current_user.id,
         name=f"{plan.name} (copy)",
     )
     db.add(new_plan)
-    db.commit()
-    db.refresh(new_plan)
+    await db.commit()
+    await db.refresh(new_plan)
 
     for it in items:
         new_item = WorkoutPlanItem(
@@ -325,6 +321,6 @@ def duplicate_plan(
         )
         db.add(new_item)
 
-    db.commit()
+    await db.commit()
 
     return WorkoutPlanResponse(id=new_plan.id, name=new_plan.name)
@@ -1,9 +1,11 @@
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
+from app.api.pagination import decode_cursor, page_with_cursor
 from app.api.schemas.workout import WorkoutCreateRequest, WorkoutResponse
 from app.models.workout import Workout
 from app.models.user import User
@@ -12,9 +14,17 @@ from app.models.exercise import Exercise
 from app.models.workout_set import WorkoutSet
 from app.api.schemas.workout import WorkoutDetailResponse
 from app.api.schemas.workout import WorkoutSetUpdateRequest
+from app.api.schemas.workout import WorkoutSetBatchCreateRequest
 from app.api.schemas.workout import WorkoutFromPlanResponse
 from app.models.workout_plan import WorkoutPlan
 from app.models.workout_plan_item import WorkoutPlanItem
+from app.services.daily_stats import refresh_daily_stats
+from app.services.overview import invalidate_overview
+from app.services.personal_records import (
+    apply_new_sets,
+    refresh_exercise_record,
+    set_holds_record,
+)
 
 router = APIRouter(prefix="/workouts", tags=["workouts"])
 
@@ -41,9 +51,9 @@ def validate_set_payload(tracking_type: str, reps, weight_kg, duration_seconds,
 
 
 @router.post("", response_model=WorkoutResponse, status_code=status.HTTP_201_CREATED)
-def start_workout(
+async def start_workout(
         payload: WorkoutCreateRequest,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> WorkoutResponse:
     started_at = payload.started_at or datetime.now(tz=timezone.utc)
@@ -55,8 +65,9 @@ def start_workout(
         notes=payload.notes,
     )
     db.add(w)
-    db.commit()
-    db.refresh(w)
+    await db.commit()
+    await db.refresh(w)
+    invalidate_overview(current_user.id)
 
     return WorkoutResponse(
         id=w.id,
@@ -67,16 +78,15 @@ def start_workout(
 
 
 @router.post("/{workout_id}/end", response_model=WorkoutResponse, status_code=status.HTTP_200_OK)
-def end_workout(
+async def end_workout(
         workout_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> WorkoutResponse:
-    w = (
-        db.query(Workout)
-        .filter(Workout.id == workout_id)
-        .filter(Workout.user_id == current_user.id)
-        .first()
+    w = await db.scalar(
+        select(Workout)
+        .where(Workout.id == workout_id)
+        .where(Workout.user_id == current_user.id)
     )
     if not w:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout not found")
@@ -86,8 +96,8 @@ def end_workout(
         return WorkoutResponse(id=w.id, started_at=w.started_at, ended_at=w.ended_at, notes=w.notes)
 
     w.ended_at = datetime.now(tz=timezone.utc)
-    db.commit()
-    db.refresh(w)
+    await db.commit()
+    await db.refresh(w)
 
     return WorkoutResponse(
         id=w.id,
@@ -102,28 +112,26 @@ def end_workout(
     response_model=WorkoutSetResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def add_set(
+async def add_set(
         workout_id: int,
         payload: WorkoutSetCreateRequest,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> WorkoutSetResponse:
     # Workout must belong to user
-    w = (
-        db.query(Workout)
-        .filter(Workout.id == workout_id)
-        .filter(Workout.user_id == current_user.id)
-        .first()
+    w = await db.scalar(
+        select(Workout)
+        .where(Workout.id == workout_id)
+        .where(Workout.user_id == current_user.id)
     )
     if not w:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout not found")
 
     # Exercise must belong to user
-    ex = (
-        db.query(Exercise)
-        .filter(Exercise.id == payload.exercise_id)
-        .filter(Exercise.user_id == current_user.id)
-        .first()
+    ex = await db.scalar(
+        select(Exercise)
+        .where(Exercise.id == payload.exercise_id)
+        .where(Exercise.user_id == current_user.id)
     )
     if not ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
@@ -162,8 +170,12 @@ def add_set(
     )
 
     db.add(s)
-    db.commit()
-    db.refresh(s)
+    await db.flush()
+    await db.run_sync(apply_new_sets, current_user.id, [s])
+    await db.run_sync(refresh_daily_stats, w, [s.exercise_id])
+    await db.commit()
+    await db.refresh(s)
+    invalidate_overview(current_user.id)
 
     return WorkoutSetResponse(
         id=s.id,
@@ -176,21 +188,123 @@ def add_set(
     )
 
 
+@router.post(
+    "/{workout_id}/sets/batch",
+    response_model=list[WorkoutSetResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_sets_batch(
+        workout_id: int,
+        payload: WorkoutSetBatchCreateRequest,
+        db: AsyncSession = Depends(get_db),
+        current_user: User = Depends(get_current_user),
+) -> list[WorkoutSetResponse]:
+    # Workout must belong to user
+    w = await db.scalar(
+        select(Workout)
+        .where(Workout.id == workout_id)
+        .where(Workout.user_id == current_user.id)
+    )
+    if not w:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout not found")
+
+    # All referenced exercises must belong to user (one query)
+    exercise_ids = {item.exercise_id for item in payload.sets}
+    tracking_by_exercise = dict(
+        (
+            await db.execute(
+                select(Exercise.id, Exercise.tracking_type)
+                .where(Exercise.id.in_(exercise_ids))
+                .where(Exercise.user_id == current_user.id)
+            )
+        ).all()
+    )
+    if len(tracking_by_exercise) != len(exercise_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
+
+    for item in payload.sets:
+        validate_set_payload(
+            tracking_by_exercise[item.exercise_id],
+            item.reps,
+            item.weight_kg,
+            item.duration_seconds,
+            item.distance_meters,
+        )
+
+    # Single multi-row INSERT ... RETURNING
+    rows = (
+        await db.execute(
+            insert(WorkoutSet)
+            .values(
+                [
+                    {
+                        "workout_id": w.id,
+                        "exercise_id": item.exercise_id,
+                        "set_number": item.set_number,
+                        "reps": item.reps,
+                        "weight_kg": item.weight_kg,
+                        "duration_seconds": item.duration_seconds,
+                        "distance_meters": item.distance_meters,
+                    }
+                    for item in payload.sets
+                ]
+            )
+            .returning(
+                WorkoutSet.id,
+                WorkoutSet.exercise_id,
+                WorkoutSet.set_number,
+                WorkoutSet.reps,
+                WorkoutSet.weight_kg,
+                WorkoutSet.duration_seconds,
+                WorkoutSet.distance_meters,
+            )
+        )
+    ).all()
+
+    await db.run_sync(apply_new_sets, current_user.id, rows)
+    await db.run_sync(refresh_daily_stats, w, exercise_ids)
+    await db.commit()
+    invalidate_overview(current_user.id)
+
+    return [
+        WorkoutSetResponse(
+            id=s.id,
+            exercise_id=s.exercise_id,
+            set_number=s.set_number,
+            reps=s.reps,
+            weight_kg=float(s.weight_kg) if s.weight_kg is not None else None,
+            duration_seconds=s.duration_seconds,
+            distance_meters=s.distance_meters,
+        )
+        for s in rows
+    ]
+
+
 @router.get("", response_model=list[WorkoutResponse], status_code=status.HTTP_200_OK)
-def list_workouts(
-        db: Session = Depends(get_db),
+async def list_workouts(
+        response: Response,
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
-        limit: int = 50,
-        offset: int = 0,
+        limit: int = Query(default=50, ge=1, le=200),
+        after: str | None = Query(default=None, description="Cursor from X-Next-Cursor"),
+        offset: int = Query(default=0, ge=0, deprecated=True),
 ) -> list[WorkoutResponse]:
+    query = select(Workout).where(Workout.user_id == current_user.id)
+
+    if after:
+        started_at, last_id = decode_cursor(after, datetime, int)
+        query = query.where(tuple_(Workout.started_at, Workout.id) < tuple_(started_at, last_id))
+        # Deprecated offset paging is ignored once a cursor is given
+        offset = 0
+
     items = (
-        db.query(Workout)
-        .filter(Workout.user_id == current_user.id)
-        .order_by(Workout.started_at.desc())
-        .limit(limit)
-        .offset(offset)
-        .all()
-    )
+        await db.scalars(
+            query.order_by(Workout.started_at.desc(), Workout.id.desc())
+            .limit(limit + 1)
+            .offset(offset)
+        )
+    ).all()
+    items = page_with_cursor(response, items, limit, lambda w: (w.started_at, w.id))
 
     return [
         WorkoutResponse(
@@ -204,26 +318,26 @@ def list_workouts(
 
 
 @router.get("/{workout_id}", response_model=WorkoutDetailResponse, status_code=status.HTTP_200_OK)
-def get_workout(
+async def get_workout(
         workout_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> WorkoutDetailResponse:
-    w = (
-        db.query(Workout)
-        .filter(Workout.id == workout_id)
-        .filter(Workout.user_id == current_user.id)
-        .first()
+    w = await db.scalar(
+        select(Workout)
+        .where(Workout.id == workout_id)
+        .where(Workout.user_id == current_user.id)
     )
     if not w:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout not found")
 
     sets = (
-        db.query(WorkoutSet)
-        .filter(WorkoutSet.workout_id == w.id)
-        .order_by(WorkoutSet.exercise_id.asc(), WorkoutSet.set_number.asc(), WorkoutSet.id.asc())
-        .all()
-    )
+        await db.scalars(
+            select(WorkoutSet)
+            .where(WorkoutSet.workout_id == w.id)
+            .order_by(WorkoutSet.exercise_id.asc(), WorkoutSet.set_number.asc(), WorkoutSet.id.asc())
+        )
+    ).all()
 
     return WorkoutDetailResponse(
         id=w.id,
@@ -250,41 +364,41 @@ def get_workout(
     response_model=WorkoutSetResponse,
     status_code=status.HTTP_200_OK,
 )
-def update_set(
+async def update_set(
         workout_id: int,
         set_id: int,
         payload: WorkoutSetUpdateRequest,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> WorkoutSetResponse:
     # Workout must belong to user
-    w = (
-        db.query(Workout)
-        .filter(Workout.id == workout_id)
-        .filter(Workout.user_id == current_user.id)
-        .first()
+    w = await db.scalar(
+        select(Workout)
+        .where(Workout.id == workout_id)
+        .where(Workout.user_id == current_user.id)
     )
     if not w:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout not found")
 
-    s = (
-        db.query(WorkoutSet)
-        .filter(WorkoutSet.id == set_id)
-        .filter(WorkoutSet.workout_id == w.id)
-        .first()
+    s = await db.scalar(
+        select(WorkoutSet)
+        .where(WorkoutSet.id == set_id)
+        .where(WorkoutSet.workout_id == w.id)
     )
     if not s:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Set not found")
 
-    ex = (
-        db.query(Exercise)
-        .filter(Exercise.id == s.exercise_id)
-        .filter(Exercise.user_id == current_user.id)
-        .first()
+    ex = await db.scalar(
+        select(Exercise)
+        .where(Exercise.id == s.exercise_id)
+        .where(Exercise.user_id == current_user.id)
     )
     if not ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
 
+    # Must be checked before the values change
+    was_record = await db.run_sync(set_holds_record, s)
+
     # Apply partial updates
     if payload.set_number is not None:
         s.set_number = payload.set_number
@@ -308,8 +422,16 @@ def update_set(
         s.distance_meters,
     )
 
-    db.commit()
-    db.refresh(s)
+    await db.flush()
+    if was_record:
+        # The edited set may no longer be the best one -> recompute this exercise
+        await db.run_sync(refresh_exercise_record, s.exercise_id)
+    else:
+        await db.run_sync(apply_new_sets, current_user.id, [s])
+    await db.run_sync(refresh_daily_stats, w, [s.exercise_id])
+
+    await db.commit()
+    await db.refresh(s)
 
     return WorkoutSetResponse(
         id=s.id,
@@ -326,32 +448,38 @@ def update_set(
     "/{workout_id}/sets/{set_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_set(
+async def delete_set(
         workout_id: int,
         set_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> None:
-    w = (
-        db.query(Workout)
-        .filter(Workout.id == workout_id)
-        .filter(Workout.user_id == current_user.id)
-        .first()
+    w = await db.scalar(
+        select(Workout)
+        .where(Workout.id == workout_id)
+        .where(Workout.user_id == current_user.id)
     )
     if not w:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout not found")
 
-    s = (
-        db.query(WorkoutSet)
-        .filter(WorkoutSet.id == set_id)
-        .filter(WorkoutSet.workout_id == w.id)
-        .first()
+    s = await db.scalar(
+        select(WorkoutSet)
+        .where(WorkoutSet.id == set_id)
+        .where(WorkoutSet.workout_id == w.id)
     )
     if not s:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Set not found")
 
-    db.delete(s)
-    db.commit()
+    was_record = await db.run_sync(set_holds_record, s)
+
+    await db.delete(s)
+    await db.flush()
+    if was_record:
+        await db.run_sync(refresh_exercise_record, s.exercise_id)
+    await db.run_sync(refresh_daily_stats, w, [s.exercise_id])
+
+    await db.commit()
+    invalidate_overview(current_user.id)
     return None
 
 
@@ -360,47 +488,43 @@ def delete_set(
     response_model=WorkoutFromPlanResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def start_workout_from_plan(
+async def start_workout_from_plan(
         plan_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> WorkoutFromPlanResponse:
-    plan = (
-        db.query(WorkoutPlan)
-        .filter(WorkoutPlan.id == plan_id)
-        .filter(WorkoutPlan.user_id == current_user.id)
-        .first()
+    plan = await db.scalar(
+        select(WorkoutPlan)
+        .where(WorkoutPlan.id == plan_id)
+        .where(WorkoutPlan.user_id == current_user.id)
     )
     if not plan:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
 
     items = (
-        db.query(WorkoutPlanItem)
-        .filter(WorkoutPlanItem.plan_id == plan.id)
-        .order_by(WorkoutPlanItem.position.asc(), WorkoutPlanItem.id.asc())
-        .all()
-    )
-
-    w = Workout(
-        user_id=current_user.id,
-        started_at=datetime.now(tz=timezone.utc),
-        ended_at=None,
-        notes=f"From plan: {plan.name}",
-    )
-    db.add(w)
-    db.commit()
-    db.refresh(w)
-
-    created_sets = 0
+        await db.scalars(
+            select(WorkoutPlanItem)
+            .where(WorkoutPlanItem.plan_id == plan.id)
+            .order_by(WorkoutPlanItem.position.asc(), WorkoutPlanItem.id.asc())
+        )
+    ).all()
+
+    # All referenced exercises in one query
+    tracking_by_exercise = dict(
+        (
+            await db.execute(
+                select(Exercise.id, Exercise.tracking_type)
+                .where(Exercise.id.in_({item.exercise_id for item in items}))
+                .where(Exercise.user_id == current_user.id)
+            )
+        ).all()
+    ) if items else {}
 
+    # Build and validate every set before writing anything
+    set_rows: list[dict] = []
     for item in items:
-        ex = (
-            db.query(Exercise)
-            .filter(Exercise.id == item.exercise_id)
-            .filter(Exercise.user_id == current_user.id)
-            .first()
-        )
-        if not ex:
+        tracking = tracking_by_exercise.get(item.exercise_id)
+        if tracking is None:
             # If exercise was deleted, skip silently for now
             continue
 
@@ -408,35 +532,64 @@ def start_workout_from_plan(
         if not item.target_sets:
             continue
 
+        # Validate final set values against tracking type
+        validate_set_payload(
+            tracking,
+            item.target_reps,
+            item.target_weight_kg,
+            item.target_duration_seconds,
+            item.target_distance_meters,
+        )
+
         for n in range(1, item.target_sets + 1):
-            s = WorkoutSet(
-                workout_id=w.id,
-                exercise_id=ex.id,
-                set_number=n,
-                reps=item.target_reps,
-                weight_kg=item.target_weight_kg,
-                duration_seconds=item.target_duration_seconds,
-                distance_meters=item.target_distance_meters,
+            set_rows.append(
+                {
+                    "exercise_id": item.exercise_id,
+                    "set_number": n,
+                    "reps": item.target_reps,
+                    "weight_kg": item.target_weight_kg,
+                    "duration_seconds": item.target_duration_seconds,
+                    "distance_meters": item.target_distance_meters,
+                }
             )
 
-            # Validate final set values against tracking type
-            validate_set_payload(
-                ex.tracking_type,
-                s.reps,
-                s.weight_kg,
-                s.duration_seconds,
-                s.distance_meters,
+    w = Workout(
+        user_id=current_user.id,
+        started_at=datetime.now(tz=timezone.utc),
+        ended_at=None,
+        notes=f"From plan: {plan.name}",
+    )
+    db.add(w)
+    await db.flush()
+
+    new_sets = []
+    if set_rows:
+        new_sets = (
+            await db.execute(
+                insert(WorkoutSet)
+                .values([{"workout_id": w.id, **row} for row in set_rows])
+                .returning(
+                    WorkoutSet.id,
+                    WorkoutSet.exercise_id,
+                    WorkoutSet.reps,
+                    WorkoutSet.weight_kg,
+                    WorkoutSet.duration_seconds,
+                    WorkoutSet.distance_meters,
+                )
             )
+        ).all()
 
-            db.add(s)
-            created_sets += 1
-
-    db.commit()
+    await db.run_sync(apply_new_sets, current_user.id, new_sets)
+    await db.run_sync(refresh_daily_stats, w, [s.exercise_id for s in new_sets])
+    await db.commit()
+    await db.refresh(w)
+    invalidate_overview(current_user.id)
 
     return WorkoutFromPlanResponse(
         id=w.id,
         started_at=w.started_at,
         ended_at=w.ended_at,
         notes=w.notes,
-        created_sets=created_sets,
+        created_sets=len(new_sets),
+        created_set_ids=[s.id for s in new_sets],
     )
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -25,3 +27,17 @@ class ExerciseResponse(BaseModel):
     equipment: str
     category: str
     tracking_type: str
+
+
+class ExerciseFromTemplatesRequest(BaseModel):
+    template_ids: list[int] = Field(min_length=1, max_length=500)
+
+
+class SkippedTemplateItem(BaseModel):
+    template_id: int
+    reason: Literal["template_not_found", "exercise_exists"]
+
+
+class ExerciseFromTemplatesResponse(BaseModel):
+    created: list[ExerciseResponse]
+    skipped: list[SkippedTemplateItem]
@@ -9,3 +9,14 @@ class ExerciseTemplateResponse(BaseModel):
     category: str
     equipment: str
     tracking_type: str
+
+
+class ExerciseTemplateDetailResponse(ExerciseTemplateResponse):
+    description: str | None = None
+    image_url: str | None = None
+    force: str | None = None
+    level: str | None = None
+    mechanic: str | None = None
+    primary_muscles: list[str] = []
+    secondary_muscles: list[str] = []
+    instructions: list[str] = []
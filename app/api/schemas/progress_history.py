@@ -11,4 +11,6 @@ class ExerciseHistoryResponse(BaseModel):
     exercise_id: int
     exercise_name: str
     tracking_type: str
+    bucket: str = "workout"
+    metric: str = "max"
     points: list[ProgressPoint]
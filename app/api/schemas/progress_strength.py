@@ -0,0 +1,19 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class StrengthPoint(BaseModel):
+    timestamp: datetime
+    best_e1rm_kg: float
+    volume_kg: float
+    rolling_volume_kg: float
+    relative_intensity: float
+
+
+class ExerciseStrengthResponse(BaseModel):
+    exercise_id: int
+    exercise_name: str
+    formula: str
+    window_days: int
+    estimated_1rm_kg: float | None
+    points: list[StrengthPoint]
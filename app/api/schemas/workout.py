@@ -29,6 +29,10 @@ class WorkoutSetCreateRequest(BaseModel):
     distance_meters: int | None = Field(default=None, ge=1)
 
 
+class WorkoutSetBatchCreateRequest(BaseModel):
+    sets: list[WorkoutSetCreateRequest] = Field(min_length=1, max_length=500)
+
+
 class WorkoutSetUpdateRequest(BaseModel):
     set_number: int | None = Field(default=None, ge=1)
 
@@ -56,3 +60,4 @@ class WorkoutDetailResponse(WorkoutResponse):
 
 class WorkoutFromPlanResponse(WorkoutResponse):
     created_sets: int
+    created_set_ids: list[int] = []
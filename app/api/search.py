@@ -0,0 +1,34 @@
+from fastapi import HTTPException, status
+from sqlalchemy import func, literal, literal_column
+
+
+# pg_trgm word similarity: "benchpress" matches "Barbell Bench Press".
+# `term <% column` is the indexable form (GIN gin_trgm_ops), threshold is
+# pg_trgm.word_similarity_threshold (0.6 by default).
+def fuzzy_match(column, term: str):
+    return literal(term).op("<%")(column)
+
+
+def fuzzy_rank(column, term: str):
+    return func.word_similarity(term, column)
+
+
+# Full-text search over a tsvector column; websearch syntax ("bench -incline", "a OR b")
+def fulltext_query(term: str):
+    return func.websearch_to_tsquery(literal_column("'english'::regconfig"), term)
+
+
+def fulltext_match(vector, tsquery):
+    return vector.op("@@")(tsquery)
+
+
+def fulltext_rank(vector, tsquery):
+    return func.ts_rank_cd(vector, tsquery)
+
+
+def reject_cursor_for_ranked_search(after: str | None) -> None:
+    if after:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination is not supported for ranked search",
+        )
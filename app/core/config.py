@@ -12,5 +12,36 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     access_token_exp_minutes: int = 30
 
+    # Async engine pool (per worker); with async handlers this, not the threadpool, caps concurrency
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+
+    # In-process caches (0 disables)
+    overview_cache_ttl_seconds: int = 60
+    overview_cache_max_users: int = 10_000
+    template_count_cache_ttl_seconds: int = 3600
+    template_count_cache_max_entries: int = 10_000
+    user_cache_ttl_seconds: int = 30
+    user_cache_max_users: int = 10_000
+    token_cache_ttl_seconds: int = 300
+    token_cache_max_entries: int = 50_000
+
+    # Argon2 runs in its own process pool (0 workers = default thread executor).
+    # Hashes are awaited on the event loop, so pending ones only queue for the
+    # process-pool workers; beyond max_pending, logins get 503 instead of waiting.
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 16
+
+    # Argon2id cost (argon2-cffi defaults); tune per host with scripts.calibrate_argon2.
+    # Existing hashes are upgraded on the next successful login.
+    argon2_time_cost: int = 3
+    argon2_memory_cost_kib: int = 65536
+    argon2_parallelism: int = 4
+
+    # How often each worker checks catalog_versions for a template reseed (0 = every request)
+    template_catalog_check_seconds: float = 30
+    # Cache-Control max-age for template detail responses (clients revalidate via ETag)
+    template_detail_max_age_seconds: int = 3600
+
 
 settings = Settings()
@@ -1,16 +1,85 @@
+import asyncio
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 
-_password_hasher = PasswordHasher()
+from app.core.config import settings
+
+_password_hasher = PasswordHasher(
+    time_cost=settings.argon2_time_cost,
+    memory_cost=settings.argon2_memory_cost_kib,
+    parallelism=settings.argon2_parallelism,
+)
+
+
+class PasswordHashingBusy(Exception):
+    pass
+
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+# Requests hashing or waiting for a worker; beyond this we fail fast
+_pending = threading.BoundedSemaphore(settings.password_hash_max_pending)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: workers must not inherit the parent's DB connections/threads
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.password_hash_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_password_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
 
 
-def hash_password(password: str) -> str:
+async def _run(fn: Callable[..., Any], *args: Any) -> Any:
+    if not _pending.acquire(blocking=False):
+        raise PasswordHashingBusy("Too many pending password hashes")
+    try:
+        # Awaited, so the event loop keeps serving other requests meanwhile
+        if settings.password_hash_workers <= 0:
+            return await asyncio.to_thread(fn, *args)
+        return await asyncio.wrap_future(_get_pool().submit(fn, *args))
+    finally:
+        _pending.release()
+
+
+# Executed inside the pool workers (module-level so they can be pickled)
+def _hash(password: str) -> str:
     return _password_hasher.hash(password)
 
 
-def verify_password(password: str, password_hash: str) -> bool:
+def _verify(password_hash: str, password: str) -> bool:
     try:
         _password_hasher.verify(password_hash, password)
         return True
     except VerifyMismatchError:
         return False
+
+
+async def hash_password(password: str) -> str:
+    return await _run(_hash, password)
+
+
+async def verify_password(password: str, password_hash: str) -> bool:
+    return await _run(_verify, password_hash, password)
+
+
+# Cheap (parses the hash header only), so it runs inline
+def needs_rehash(password_hash: str) -> bool:
+    return _password_hasher.check_needs_rehash(password_hash)
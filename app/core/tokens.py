@@ -1,7 +1,10 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 
 import jwt
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from typing import Any
 from jwt import ExpiredSignatureError, InvalidTokenError
@@ -26,7 +29,32 @@ def create_access_token(subject: str) -> str:
     return token
 
 
+# sha256(token) -> verified claims. Entries never outlive the token's own exp,
+# so a cached hit is exactly as valid as a fresh verification would be.
+_token_cache = TTLCache(
+    maxsize=settings.token_cache_max_entries,
+    ttl_seconds=settings.token_cache_ttl_seconds,
+)
+
+
+def token_cache_stats() -> dict[str, int]:
+    return _token_cache.stats()
+
+
 def decode_access_token(token: str) -> dict[str, Any]:
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+
+    payload = _verify_access_token(token)
+
+    remaining = payload["exp"] - time.time() if "exp" in payload else 0
+    _token_cache.set(key, payload, ttl_seconds=min(settings.token_cache_ttl_seconds, remaining))
+    return dict(payload)
+
+
+def _verify_access_token(token: str) -> dict[str, Any]:
     try:
         payload = jwt.decode(
             token,
@@ -1,12 +1,36 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
+
 from app.api.routes.auth import router as auth_router
 from app.api.routes.exercise_templates import router as exercise_templates_router
 from app.api.routes.exercises import router as exercises_router
 from app.api.routes.workouts import router as workouts_router
 from app.api.routes.progress import router as progress_router
 from app.api.routes.workout_plans import router as workout_plans_router
+from app.core.db import SessionLocal
+from app.core.security import shutdown_password_pool
+from app.core.tokens import token_cache_stats
+from app.services.template_catalog import reload_catalog
+from app.services.user_cache import user_cache_stats
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the template catalog; if the DB is not reachable yet the first request loads it
+    db = SessionLocal()
+    try:
+        reload_catalog(db)
+    except SQLAlchemyError:
+        pass
+    finally:
+        db.close()
+    yield
+    shutdown_password_pool()
 
-app = FastAPI(title="Fitness Tracker API", version="0.1.0")
+
+app = FastAPI(title="Fitness Tracker API", version="0.1.0", lifespan=lifespan)
 app.include_router(auth_router)
 app.include_router(exercise_templates_router)
 app.include_router(exercises_router)
@@ -23,3 +47,9 @@ def root() -> dict:
 @app.get("/health")
 def health() -> dict:
     return {"status": "ok"}
+
+
+@app.get("/health/caches")
+def cache_health() -> dict:
+    # Per-worker hit/miss counters of the in-process caches
+    return {"tokens": token_cache_stats(), "users": user_cache_stats()}
@@ -6,6 +6,9 @@ from app.models.workout import Workout
 from app.models.workout_set import WorkoutSet
 from app.models.workout_plan import WorkoutPlan
 from app.models.workout_plan_item import WorkoutPlanItem
+from app.models.exercise_personal_record import ExercisePersonalRecord
+from app.models.exercise_daily_stat import ExerciseDailyStat
+from app.models.catalog_version import CatalogVersion
 
 __all__ = [
     "Base",
@@ -16,4 +19,7 @@ __all__ = [
     "WorkoutSet",
     "workout_plan",
     "workout_plan_item",
+    "ExercisePersonalRecord",
+    "ExerciseDailyStat",
+    "CatalogVersion",
 ]
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+TEMPLATE_CATALOG = "exercise_templates"
+
+
+class CatalogVersion(Base):
+    __tablename__ = "catalog_versions"
+
+    # One row per shared catalog (currently only exercise_templates)
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    # Bumped by every reseed; app workers reload their in-memory copy when it changes
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
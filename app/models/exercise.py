@@ -1,15 +1,31 @@
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
 
+NAME_CONSTRAINT = "uq_exercises_user_id_name_normalized"
+
 
 class Exercise(Base):
     __tablename__ = "exercises"
+    __table_args__ = (
+        # Keyset pagination: WHERE user_id = ? ORDER BY name, id
+        # (also serves every plain user_id lookup)
+        Index("ix_exercises_user_id_name_id", "user_id", "name", "id"),
+        # Fuzzy / substring search (requires pg_trgm)
+        Index(
+            "ix_exercises_name_normalized_trgm",
+            "name_normalized",
+            postgresql_using="gin",
+            postgresql_ops={"name_normalized": "gin_trgm_ops"},
+        ),
+        # One exercise per name per user; creates rely on ON CONFLICT against it
+        UniqueConstraint("user_id", "name_normalized", name=NAME_CONSTRAINT),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     template_id: Mapped[int | None] = mapped_column(
         ForeignKey("exercise_templates.id"),
         index=True,
@@ -17,7 +33,7 @@ class Exercise(Base):
     )
 
     name: Mapped[str] = mapped_column(String(200), nullable=False)
-    name_normalized: Mapped[str] = mapped_column(String(200), index=True, nullable=False)
+    name_normalized: Mapped[str] = mapped_column(String(200), nullable=False)
 
     muscle_group: Mapped[str] = mapped_column(String(50), nullable=False)
     equipment: Mapped[str] = mapped_column(String(50), nullable=False)
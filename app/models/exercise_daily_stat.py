@@ -0,0 +1,31 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Integer, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ExerciseDailyStat(Base):
+    __tablename__ = "exercise_daily_stats"
+
+    exercise_id: Mapped[int] = mapped_column(
+        ForeignKey("exercises.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Training day in UTC (workouts.started_at)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+
+    set_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Strength (weight x reps)
+    best_set_volume: Mapped[float | None] = mapped_column(Numeric(12, 2), nullable=True)
+    total_volume: Mapped[float | None] = mapped_column(Numeric(14, 2), nullable=True)
+
+    # Time / Distance
+    best_duration_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    total_duration_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    best_distance_meters: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    total_distance_meters: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -0,0 +1,24 @@
+from sqlalchemy import ForeignKey, Integer, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ExercisePersonalRecord(Base):
+    __tablename__ = "exercise_personal_records"
+
+    # One row per exercise that has at least one logged set
+    exercise_id: Mapped[int] = mapped_column(
+        ForeignKey("exercises.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+
+    # Strength (heaviest set, ties -> more reps)
+    best_weight_kg: Mapped[float | None] = mapped_column(Numeric(6, 2), nullable=True)
+    best_reps: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    best_weight_set_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    # Time / Distance
+    best_duration_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    best_distance_meters: Mapped[int | None] = mapped_column(Integer, nullable=True)
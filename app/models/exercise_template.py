@@ -1,12 +1,48 @@
-from sqlalchemy import String, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Computed, Index, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
 
+# Full-text document: name (A) > muscles (B) > instructions (C)
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(name, '')), 'A') || "
+    "setweight(jsonb_to_tsvector('english'::regconfig, primary_muscles || secondary_muscles, "
+    "'[\"string\"]'), 'B') || "
+    "setweight(jsonb_to_tsvector('english'::regconfig, instructions, '[\"string\"]'), 'C')"
+)
+
+# Columns ExerciseTemplateResponse needs; list queries load only these
+LIST_COLUMNS = ("id", "source_id", "slug", "name", "category", "equipment", "tracking_type")
+
 
 class ExerciseTemplate(Base):
     __tablename__ = "exercise_templates"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY name, id
+        Index("ix_exercise_templates_name_id", "name", "id"),
+        # Fuzzy / substring search (requires pg_trgm)
+        Index(
+            "ix_exercise_templates_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_exercise_templates_search_vector", "search_vector", postgresql_using="gin"),
+        # Muscle filters: primary_muscles @> '["chest"]' (either column, BitmapOr/And)
+        Index(
+            "ix_exercise_templates_primary_muscles",
+            "primary_muscles",
+            postgresql_using="gin",
+            postgresql_ops={"primary_muscles": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_exercise_templates_secondary_muscles",
+            "secondary_muscles",
+            postgresql_using="gin",
+            postgresql_ops={"secondary_muscles": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -29,7 +65,13 @@ class ExerciseTemplate(Base):
     # Neutral name (English for now, LP later)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
 
-    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Bulky detail-only columns are deferred (group "details"); list queries never need them
+    description: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        deferred=True,
+        deferred_group="details",
+    )
 
     # Optional media (URL only, later you can point to your own images/CDN)
     image_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
@@ -45,4 +87,20 @@ class ExerciseTemplate(Base):
 
     primary_muscles: Mapped[list[str]] = mapped_column(JSONB, nullable=False, default=list)
     secondary_muscles: Mapped[list[str]] = mapped_column(JSONB, nullable=False, default=list)
-    instructions: Mapped[list[str]] = mapped_column(JSONB, nullable=False, default=list)
+    instructions: Mapped[list[str]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=list,
+        deferred=True,
+        deferred_group="details",
+    )
+
+    # sha256 of the dataset fields; the seed script skips rows whose hash is unchanged
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, deferred=True)
+
+    # Generated by Postgres; deferred so list queries never load it
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+    )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -8,10 +8,15 @@ from app.models.base import Base
 
 class Workout(Base):
     __tablename__ = "workouts"
+    __table_args__ = (
+        # Keyset pagination / date ranges: WHERE user_id = ? ORDER BY started_at, id
+        # (also serves every plain user_id lookup)
+        Index("ix_workouts_user_id_started_at_id", "user_id", "started_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
 
     started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     ended_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Integer, Numeric
+from sqlalchemy import ForeignKey, Index, Integer, Numeric
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -6,11 +6,22 @@ from app.models.base import Base
 
 class WorkoutSet(Base):
     __tablename__ = "workout_sets"
+    __table_args__ = (
+        # PRs, history, strength: WHERE exercise_id = ? JOIN workouts (index-only for values)
+        Index(
+            "ix_workout_sets_exercise_id_workout_id",
+            "exercise_id",
+            "workout_id",
+            postgresql_include=["weight_kg", "reps", "duration_seconds", "distance_meters"],
+        ),
+        # Workout detail: WHERE workout_id = ? ORDER BY exercise_id, set_number
+        Index("ix_workout_sets_workout_id_exercise_id_set_number", "workout_id", "exercise_id", "set_number"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
-    workout_id: Mapped[int] = mapped_column(ForeignKey("workouts.id"), index=True, nullable=False)
-    exercise_id: Mapped[int] = mapped_column(ForeignKey("exercises.id"), index=True, nullable=False)
+    workout_id: Mapped[int] = mapped_column(ForeignKey("workouts.id"), nullable=False)
+    exercise_id: Mapped[int] = mapped_column(ForeignKey("exercises.id"), nullable=False)
 
     set_number: Mapped[int] = mapped_column(Integer, nullable=False)
 
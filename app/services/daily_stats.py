@@ -0,0 +1,112 @@
+from collections.abc import Iterable
+from datetime import datetime, time, timedelta, timezone
+
+from sqlalchemy import delete, func, insert, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.exercise import Exercise
+from app.models.exercise_daily_stat import ExerciseDailyStat
+from app.models.workout import Workout
+from app.models.workout_set import WorkoutSet
+
+STAT_COLUMNS = [
+    "user_id",
+    "exercise_id",
+    "day",
+    "set_count",
+    "best_set_volume",
+    "total_volume",
+    "best_duration_seconds",
+    "total_duration_seconds",
+    "best_distance_meters",
+    "total_distance_meters",
+]
+
+
+def training_day_expression():
+    # Inline 'UTC' so SELECT and GROUP BY render the identical expression
+    return func.date(func.timezone(literal_column("'UTC'"), Workout.started_at))
+
+
+def aggregate_daily_stats_query(*filters):
+    day = training_day_expression()
+    volume = WorkoutSet.weight_kg * WorkoutSet.reps
+
+    return (
+        select(
+            Exercise.user_id,
+            WorkoutSet.exercise_id,
+            day,
+            func.count(WorkoutSet.id),
+            func.max(volume),
+            func.sum(volume),
+            func.max(WorkoutSet.duration_seconds),
+            func.sum(WorkoutSet.duration_seconds),
+            func.max(WorkoutSet.distance_meters),
+            func.sum(WorkoutSet.distance_meters),
+        )
+        .select_from(WorkoutSet)
+        .join(Workout, Workout.id == WorkoutSet.workout_id)
+        .join(Exercise, Exercise.id == WorkoutSet.exercise_id)
+        .where(*filters)
+        .group_by(Exercise.user_id, WorkoutSet.exercise_id, day)
+    )
+
+
+def rebuild_daily_stats(db: Session, user_id: int | None = None) -> int:
+    stmt = delete(ExerciseDailyStat)
+    filters = []
+    if user_id is not None:
+        stmt = stmt.where(ExerciseDailyStat.user_id == user_id)
+        filters.append(Exercise.user_id == user_id)
+
+    db.execute(stmt)
+    db.execute(
+        insert(ExerciseDailyStat).from_select(
+            STAT_COLUMNS,
+            aggregate_daily_stats_query(*filters),
+        )
+    )
+
+    count_stmt = select(func.count()).select_from(ExerciseDailyStat)
+    if user_id is not None:
+        count_stmt = count_stmt.where(ExerciseDailyStat.user_id == user_id)
+    return db.scalar(count_stmt)
+
+
+# Recompute the rollup rows touched by a write to `w` (sets must be flushed)
+def refresh_daily_stats(db: Session, w: Workout, exercise_ids: Iterable[int]) -> None:
+    exercise_ids = sorted(set(exercise_ids))
+    if not exercise_ids:
+        return
+
+    day = w.started_at.astimezone(timezone.utc).date()
+    day_start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+    # Upsert instead of delete + insert: concurrent writers for the same (exercise, day)
+    # then update the row in turn rather than colliding on the primary key
+    stmt = pg_insert(ExerciseDailyStat).from_select(
+        STAT_COLUMNS,
+        aggregate_daily_stats_query(
+            WorkoutSet.exercise_id.in_(exercise_ids),
+            Workout.user_id == w.user_id,
+            # Range on started_at (not the day expression) keeps this indexable
+            Workout.started_at >= day_start,
+            Workout.started_at < day_start + timedelta(days=1),
+        ).order_by(WorkoutSet.exercise_id),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ExerciseDailyStat.exercise_id, ExerciseDailyStat.day],
+        set_={c: stmt.excluded[c] for c in STAT_COLUMNS if c not in ("exercise_id", "day")},
+    ).returning(ExerciseDailyStat.exercise_id)
+    written = set(db.scalars(stmt))
+
+    # Exercises without sets left on that day lose their row
+    emptied = [e for e in exercise_ids if e not in written]
+    if emptied:
+        db.execute(
+            delete(ExerciseDailyStat)
+            .where(ExerciseDailyStat.exercise_id.in_(emptied))
+            .where(ExerciseDailyStat.day == day)
+        )
@@ -0,0 +1,43 @@
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+# Largest-Triangle-Three-Buckets: keeps the visual shape of a series while
+# reducing it to `threshold` points (first and last point are always kept).
+def lttb(points: list[T], xs: list[float], ys: list[float], threshold: int) -> list[T]:
+    n = len(points)
+    if threshold >= n or threshold < 3:
+        return points
+
+    sampled = [points[0]]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle corner
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        span = max(next_end - next_start, 1)
+        avg_x = sum(xs[next_start:next_end]) / span
+        avg_y = sum(ys[next_start:next_end]) / span
+
+        # Pick the point in the current bucket with the largest triangle area
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        best_area = -1.0
+        best_idx = start
+        for j in range(start, end):
+            area = abs(
+                (xs[a] - avg_x) * (ys[j] - ys[a])
+                - (xs[a] - xs[j]) * (avg_y - ys[a])
+            )
+            if area > best_area:
+                best_area = area
+                best_idx = j
+
+        sampled.append(points[best_idx])
+        a = best_idx
+
+    sampled.append(points[-1])
+    return sampled
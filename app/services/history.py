@@ -0,0 +1,129 @@
+from datetime import date, datetime, timezone
+
+from sqlalchemy import DateTime, cast, func, literal_column, select
+from sqlalchemy.orm import Session
+
+from app.models.exercise import Exercise
+from app.models.exercise_daily_stat import ExerciseDailyStat
+from app.models.workout import Workout
+from app.models.workout_set import WorkoutSet
+
+# (tracking_type, metric) -> pre-aggregated daily column
+ROLLUP_COLUMNS = {
+    ("weight_reps", "max"): ExerciseDailyStat.best_set_volume,
+    ("weight_reps", "sum"): ExerciseDailyStat.total_volume,
+    ("time", "max"): ExerciseDailyStat.best_duration_seconds,
+    ("time", "sum"): ExerciseDailyStat.total_duration_seconds,
+    ("distance", "max"): ExerciseDailyStat.best_distance_meters,
+    ("distance", "sum"): ExerciseDailyStat.total_distance_meters,
+}
+
+
+def set_value_expression(tracking_type: str):
+    # weight_reps -> weight x reps (volume of the set), time/distance -> raw value
+    if tracking_type == "weight_reps":
+        return WorkoutSet.weight_kg * WorkoutSet.reps
+    if tracking_type == "time":
+        return WorkoutSet.duration_seconds
+    if tracking_type == "distance":
+        return WorkoutSet.distance_meters
+    return None
+
+
+def _as_utc_datetime(value: date | datetime) -> datetime:
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _workout_points(
+        db: Session,
+        ex: Exercise,
+        metric: str,
+        date_from: datetime | None,
+        date_to: datetime | None,
+) -> list[tuple[datetime, float]]:
+    value = set_value_expression(ex.tracking_type)
+    if value is None:
+        return []
+
+    agg = func.max(value) if metric == "max" else func.sum(value)
+
+    # One point per workout, timestamped at its start
+    stmt = (
+        select(func.min(Workout.started_at).label("ts"), agg.label("value"))
+        .select_from(WorkoutSet)
+        .join(Workout, Workout.id == WorkoutSet.workout_id)
+        .where(WorkoutSet.exercise_id == ex.id)
+        .where(Workout.user_id == ex.user_id)
+        .where(value.is_not(None))
+        .group_by(Workout.id)
+        .order_by("ts")
+    )
+
+    if date_from is not None:
+        stmt = stmt.where(Workout.started_at >= date_from)
+    if date_to is not None:
+        stmt = stmt.where(Workout.started_at <= date_to)
+
+    return [(row.ts, float(row.value)) for row in db.execute(stmt)]
+
+
+def _rollup_points(
+        db: Session,
+        ex: Exercise,
+        bucket: str,
+        metric: str,
+        date_from: datetime | None,
+        date_to: datetime | None,
+) -> list[tuple[datetime, float]]:
+    column = ROLLUP_COLUMNS.get((ex.tracking_type, metric))
+    if column is None:
+        return []
+
+    if bucket == "day":
+        ts = ExerciseDailyStat.day
+        value = column
+    else:
+        # Inline the unit so SELECT and GROUP BY render the identical expression
+        ts = func.date_trunc(literal_column(f"'{bucket}'"), cast(ExerciseDailyStat.day, DateTime))
+        value = func.max(column) if metric == "max" else func.sum(column)
+
+    stmt = (
+        select(ts.label("ts"), value.label("value"))
+        .where(ExerciseDailyStat.exercise_id == ex.id)
+        .where(ExerciseDailyStat.user_id == ex.user_id)
+        .where(column.is_not(None))
+        .order_by("ts")
+    )
+    if bucket != "day":
+        stmt = stmt.group_by(ts)
+
+    if date_from is not None:
+        stmt = stmt.where(ExerciseDailyStat.day >= date_from.astimezone(timezone.utc).date())
+    if date_to is not None:
+        stmt = stmt.where(ExerciseDailyStat.day <= date_to.astimezone(timezone.utc).date())
+
+    return [(_as_utc_datetime(row.ts), float(row.value)) for row in db.execute(stmt)]
+
+
+def history_points(
+        db: Session,
+        ex: Exercise,
+        bucket: str = "workout",
+        metric: str = "max",
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+) -> list[tuple[datetime, float]]:
+    # Naive bounds are UTC, not the server's local time
+    if date_from is not None:
+        date_from = _as_utc_datetime(date_from)
+    if date_to is not None:
+        date_to = _as_utc_datetime(date_to)
+
+    # Per-workout points need set granularity; everything coarser reads the daily rollup
+    if bucket == "workout":
+        return _workout_points(db, ex, metric, date_from, date_to)
+    return _rollup_points(db, ex, bucket, metric, date_from, date_to)
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select, true
+from sqlalchemy.orm import Session
+
+from app.api.schemas.progress_overview import ProgressOverviewResponse, TopExerciseItem
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.exercise import Exercise
+from app.models.workout import Workout
+from app.models.workout_set import WorkoutSet
+
+# user_id -> (start_of_week, response)
+_overview_cache = TTLCache(
+    maxsize=settings.overview_cache_max_users,
+    ttl_seconds=settings.overview_cache_ttl_seconds,
+)
+
+
+def invalidate_overview(user_id: int) -> None:
+    _overview_cache.invalidate(user_id)
+
+
+def _query_overview(
+        db: Session,
+        user_id: int,
+        start_of_week: datetime,
+        now: datetime,
+) -> ProgressOverviewResponse:
+    week_workouts = (
+        select(Workout.id)
+        .where(Workout.user_id == user_id)
+        .where(Workout.started_at >= start_of_week)
+        .where(Workout.started_at <= now)
+        .cte("week_workouts")
+    )
+
+    week_sets = (
+        select(WorkoutSet.id, WorkoutSet.exercise_id)
+        .join(week_workouts, week_workouts.c.id == WorkoutSet.workout_id)
+        .cte("week_sets")
+    )
+
+    # Top exercises this week by number of sets
+    top = (
+        select(week_sets.c.exercise_id, func.count().label("sets_count"))
+        .group_by(week_sets.c.exercise_id)
+        .order_by(func.count().desc(), week_sets.c.exercise_id)
+        .limit(5)
+        .cte("top_exercises")
+    )
+
+    totals = select(
+        select(func.count()).select_from(week_workouts).scalar_subquery().label("workouts"),
+        select(func.count()).select_from(week_sets).scalar_subquery().label("sets"),
+    ).cte("totals")
+
+    # totals is always one row; LEFT JOIN keeps it when there are no top exercises
+    rows = db.execute(
+        select(
+            totals.c.workouts,
+            totals.c.sets,
+            top.c.exercise_id,
+            top.c.sets_count,
+            Exercise.name,
+        )
+        .select_from(totals)
+        .outerjoin(top, true())
+        .outerjoin(
+            Exercise,
+            (Exercise.id == top.c.exercise_id) & (Exercise.user_id == user_id),
+        )
+        .order_by(top.c.sets_count.desc().nulls_last(), top.c.exercise_id)
+    ).all()
+
+    return ProgressOverviewResponse(
+        workouts_this_week=int(rows[0].workouts or 0),
+        sets_this_week=int(rows[0].sets or 0),
+        top_exercises_this_week=[
+            TopExerciseItem(
+                exercise_id=r.exercise_id,
+                exercise_name=r.name or "Unknown",
+                sets_count=int(r.sets_count),
+            )
+            for r in rows
+            if r.exercise_id is not None
+        ],
+    )
+
+
+def get_overview(db: Session, user_id: int) -> ProgressOverviewResponse:
+    now = datetime.now(tz=timezone.utc)
+
+    # Start of week (Monday 00:00) in UTC
+    start_of_week = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=now.weekday())
+
+    cached = _overview_cache.get(user_id)
+    if cached is not None and cached[0] == start_of_week:
+        return cached[1]
+
+    result = _query_overview(db, user_id, start_of_week, now)
+    _overview_cache.set(user_id, (start_of_week, result))
+    return result
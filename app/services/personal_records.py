@@ -0,0 +1,275 @@
+from collections.abc import Sequence
+
+from sqlalchemy import and_, case, delete, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.api.schemas.progress import ExercisePRResponse
+from app.models.exercise import Exercise
+from app.models.exercise_personal_record import ExercisePersonalRecord
+from app.models.workout_set import WorkoutSet
+
+RECORD_COLUMNS = [
+    "exercise_id",
+    "user_id",
+    "best_weight_kg",
+    "best_reps",
+    "best_weight_set_id",
+    "best_duration_seconds",
+    "best_distance_meters",
+]
+
+
+def build_pr_response(
+        exercise_id: int,
+        exercise_name: str,
+        tracking_type: str,
+        best_weight_kg,
+        best_reps: int | None,
+        best_duration_seconds: int | None,
+        best_distance_meters: int | None,
+) -> ExercisePRResponse:
+    # Only expose the PR fields that belong to the exercise's tracking type
+    if tracking_type == "weight_reps":
+        return ExercisePRResponse(
+            exercise_id=exercise_id,
+            exercise_name=exercise_name,
+            tracking_type=tracking_type,
+            best_weight_kg=float(best_weight_kg) if best_weight_kg is not None else None,
+            best_reps=best_reps if best_weight_kg is not None else None,
+        )
+
+    if tracking_type == "time":
+        return ExercisePRResponse(
+            exercise_id=exercise_id,
+            exercise_name=exercise_name,
+            tracking_type=tracking_type,
+            best_duration_seconds=best_duration_seconds or None,
+        )
+
+    if tracking_type == "distance":
+        return ExercisePRResponse(
+            exercise_id=exercise_id,
+            exercise_name=exercise_name,
+            tracking_type=tracking_type,
+            best_distance_meters=best_distance_meters or None,
+        )
+
+    # unknown tracking type -> return empty PR values
+    return ExercisePRResponse(
+        exercise_id=exercise_id,
+        exercise_name=exercise_name,
+        tracking_type=tracking_type,
+    )
+
+
+def get_personal_records(db: Session, user_id: int) -> list[ExercisePRResponse]:
+    rows = db.execute(
+        select(
+            Exercise.id,
+            Exercise.name,
+            Exercise.tracking_type,
+            ExercisePersonalRecord.best_weight_kg,
+            ExercisePersonalRecord.best_reps,
+            ExercisePersonalRecord.best_duration_seconds,
+            ExercisePersonalRecord.best_distance_meters,
+        )
+        .outerjoin(
+            ExercisePersonalRecord,
+            # user_id lets the planner use the per-user index instead of scanning all records
+            and_(
+                ExercisePersonalRecord.exercise_id == Exercise.id,
+                ExercisePersonalRecord.user_id == user_id,
+            ),
+        )
+        .where(Exercise.user_id == user_id)
+        .order_by(Exercise.name.asc())
+    ).all()
+
+    return [build_pr_response(*row) for row in rows]
+
+
+# Compute PR rows straight from workout_sets (used for rebuild/repair)
+def aggregate_records_query(*exercise_filters):
+    # Heaviest set per exercise (ties -> more reps, then earliest set)
+    best_weight = (
+        select(
+            WorkoutSet.exercise_id.label("exercise_id"),
+            WorkoutSet.weight_kg.label("weight_kg"),
+            WorkoutSet.reps.label("reps"),
+            WorkoutSet.id.label("set_id"),
+        )
+        .join(Exercise, Exercise.id == WorkoutSet.exercise_id)
+        .where(*exercise_filters)
+        .where(WorkoutSet.weight_kg.is_not(None))
+        .distinct(WorkoutSet.exercise_id)
+        .order_by(
+            WorkoutSet.exercise_id,
+            WorkoutSet.weight_kg.desc(),
+            WorkoutSet.reps.desc().nulls_last(),
+            WorkoutSet.id.asc(),
+        )
+        .subquery("best_weight")
+    )
+
+    best_other = (
+        select(
+            WorkoutSet.exercise_id.label("exercise_id"),
+            Exercise.user_id.label("user_id"),
+            func.max(WorkoutSet.duration_seconds).label("duration_seconds"),
+            func.max(WorkoutSet.distance_meters).label("distance_meters"),
+        )
+        .join(Exercise, Exercise.id == WorkoutSet.exercise_id)
+        .where(*exercise_filters)
+        .group_by(WorkoutSet.exercise_id, Exercise.user_id)
+        .subquery("best_other")
+    )
+
+    return (
+        select(
+            best_other.c.exercise_id,
+            best_other.c.user_id,
+            best_weight.c.weight_kg,
+            best_weight.c.reps,
+            best_weight.c.set_id,
+            best_other.c.duration_seconds,
+            best_other.c.distance_meters,
+        )
+        .outerjoin(best_weight, best_weight.c.exercise_id == best_other.c.exercise_id)
+    )
+
+
+def rebuild_personal_records(db: Session, user_id: int | None = None) -> int:
+    stmt = delete(ExercisePersonalRecord)
+    filters = []
+    if user_id is not None:
+        stmt = stmt.where(ExercisePersonalRecord.user_id == user_id)
+        filters.append(Exercise.user_id == user_id)
+
+    db.execute(stmt)
+    db.execute(
+        insert(ExercisePersonalRecord).from_select(
+            RECORD_COLUMNS,
+            aggregate_records_query(*filters),
+        )
+    )
+
+    count_stmt = select(func.count()).select_from(ExercisePersonalRecord)
+    if user_id is not None:
+        count_stmt = count_stmt.where(ExercisePersonalRecord.user_id == user_id)
+    return db.scalar(count_stmt)
+
+
+def refresh_exercise_record(db: Session, exercise_id: int) -> None:
+    # Upsert replacing every value (the record may go down); delete + insert would let
+    # two concurrent recomputes collide on the primary key
+    stmt = pg_insert(ExercisePersonalRecord).from_select(
+        RECORD_COLUMNS,
+        aggregate_records_query(Exercise.id == exercise_id),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ExercisePersonalRecord.exercise_id],
+        set_={c: stmt.excluded[c] for c in RECORD_COLUMNS if c != "exercise_id"},
+    ).returning(ExercisePersonalRecord.exercise_id)
+
+    # No sets left -> no record
+    if db.scalar(stmt) is None:
+        db.execute(
+            delete(ExercisePersonalRecord).where(ExercisePersonalRecord.exercise_id == exercise_id)
+        )
+
+
+def set_holds_record(db: Session, s: WorkoutSet) -> bool:
+    rec = db.get(ExercisePersonalRecord, s.exercise_id)
+    if not rec:
+        return False
+
+    return (
+        rec.best_weight_set_id == s.id
+        or (s.duration_seconds is not None and s.duration_seconds == rec.best_duration_seconds)
+        or (s.distance_meters is not None and s.distance_meters == rec.best_distance_meters)
+    )
+
+
+def _is_heavier(a, b) -> bool:
+    if a.weight_kg is None:
+        return False
+    if b.weight_kg is None or a.weight_kg > b.weight_kg:
+        return True
+    return a.weight_kg == b.weight_kg and (a.reps or 0) > (b.reps or 0)
+
+
+# Fold freshly written sets into the stored PRs. Accepts flushed WorkoutSet
+# objects or rows returned by INSERT ... RETURNING (anything with set attributes).
+def apply_new_sets(db: Session, user_id: int, sets: Sequence) -> None:
+    if not sets:
+        return
+
+    # Reduce to one candidate row per exercise so a single upsert can apply them
+    candidates: dict[int, dict] = {}
+    for s in sets:
+        c = candidates.get(s.exercise_id)
+        if c is None:
+            candidates[s.exercise_id] = {
+                "exercise_id": s.exercise_id,
+                "user_id": user_id,
+                "best_weight_kg": s.weight_kg,
+                "best_reps": s.reps if s.weight_kg is not None else None,
+                "best_weight_set_id": s.id if s.weight_kg is not None else None,
+                "best_duration_seconds": s.duration_seconds,
+                "best_distance_meters": s.distance_meters,
+                "_set": s,
+            }
+            continue
+
+        if _is_heavier(s, c["_set"]):
+            c["best_weight_kg"] = s.weight_kg
+            c["best_reps"] = s.reps
+            c["best_weight_set_id"] = s.id
+            c["_set"] = s
+        if s.duration_seconds is not None:
+            c["best_duration_seconds"] = max(c["best_duration_seconds"] or 0, s.duration_seconds)
+        if s.distance_meters is not None:
+            c["best_distance_meters"] = max(c["best_distance_meters"] or 0, s.distance_meters)
+
+    for c in candidates.values():
+        c.pop("_set")
+
+    # Rows are locked in VALUES order; a fixed order keeps concurrent batches from deadlocking
+    stmt = pg_insert(ExercisePersonalRecord).values(
+        [candidates[exercise_id] for exercise_id in sorted(candidates)]
+    )
+    current = ExercisePersonalRecord.__table__.c
+    new = stmt.excluded
+
+    heavier = and_(
+        new.best_weight_kg.is_not(None),
+        or_(
+            current.best_weight_kg.is_(None),
+            new.best_weight_kg > current.best_weight_kg,
+            and_(
+                new.best_weight_kg == current.best_weight_kg,
+                func.coalesce(new.best_reps, 0) > func.coalesce(current.best_reps, 0),
+            ),
+        ),
+    )
+
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[current.exercise_id],
+        set_={
+            "best_weight_kg": case((heavier, new.best_weight_kg), else_=current.best_weight_kg),
+            "best_reps": case((heavier, new.best_reps), else_=current.best_reps),
+            "best_weight_set_id": case(
+                (heavier, new.best_weight_set_id),
+                else_=current.best_weight_set_id,
+            ),
+            # GREATEST ignores NULLs in Postgres
+            "best_duration_seconds": func.greatest(
+                current.best_duration_seconds, new.best_duration_seconds
+            ),
+            "best_distance_meters": func.greatest(
+                current.best_distance_meters, new.best_distance_meters
+            ),
+        },
+    )
+    db.execute(stmt)
@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy import Float, cast, func, select
+from sqlalchemy.orm import Session
+
+from app.models.exercise import Exercise
+from app.models.workout import Workout
+from app.models.workout_set import WorkoutSet
+
+
+@dataclass(frozen=True)
+class StrengthColumns:
+    workout_ids: np.ndarray  # int64, sorted by workout start
+    epochs: np.ndarray  # float64 seconds (workout started_at)
+    weights: np.ndarray  # float64 kg
+    reps: np.ndarray  # float64
+
+
+@dataclass(frozen=True)
+class StrengthSeries:
+    epochs: np.ndarray  # one entry per workout
+    best_e1rm: np.ndarray
+    volume: np.ndarray
+    rolling_volume: np.ndarray
+    relative_intensity: np.ndarray
+
+
+def load_strength_columns(db: Session, ex: Exercise) -> StrengthColumns:
+    # Single narrow projection; casts keep Decimal/datetime objects out of the hot path
+    rows = db.execute(
+        select(
+            Workout.id,
+            cast(func.extract("epoch", Workout.started_at), Float),
+            cast(WorkoutSet.weight_kg, Float),
+            cast(WorkoutSet.reps, Float),
+        )
+        .join(Workout, Workout.id == WorkoutSet.workout_id)
+        .where(WorkoutSet.exercise_id == ex.id)
+        .where(Workout.user_id == ex.user_id)
+        .where(WorkoutSet.weight_kg.is_not(None))
+        .where(WorkoutSet.reps.is_not(None))
+        .order_by(Workout.started_at.asc(), Workout.id.asc())
+    ).all()
+
+    if not rows:
+        empty = np.empty(0, dtype=np.float64)
+        return StrengthColumns(np.empty(0, dtype=np.int64), empty, empty, empty)
+
+    workout_ids, epochs, weights, reps = zip(*rows)
+    return StrengthColumns(
+        workout_ids=np.asarray(workout_ids, dtype=np.int64),
+        epochs=np.asarray(epochs, dtype=np.float64),
+        weights=np.asarray(weights, dtype=np.float64),
+        reps=np.asarray(reps, dtype=np.float64),
+    )
+
+
+def estimated_1rm(weights: np.ndarray, reps: np.ndarray, formula: str = "epley") -> np.ndarray:
+    if formula == "epley":
+        e1rm = weights * (1.0 + reps / 30.0)
+    elif formula == "brzycki":
+        # Undefined at 37+ reps -> clamp
+        e1rm = weights * 36.0 / (37.0 - np.minimum(reps, 36.0))
+    else:
+        raise ValueError(f"Unknown formula: {formula}")
+
+    # A single rep is the 1RM by definition
+    return np.where(reps <= 1.0, weights, e1rm)
+
+
+def compute_strength_series(
+        cols: StrengthColumns,
+        formula: str = "epley",
+        window_days: int = 28,
+) -> StrengthSeries:
+    if cols.workout_ids.size == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return StrengthSeries(empty, empty, empty, empty, empty)
+
+    # Rows are sorted by workout, so each workout is a contiguous run
+    starts = np.flatnonzero(np.r_[True, cols.workout_ids[1:] != cols.workout_ids[:-1]])
+
+    e1rm = estimated_1rm(cols.weights, cols.reps, formula)
+    set_volume = cols.weights * cols.reps
+
+    epochs = cols.epochs[starts]
+    best_e1rm = np.maximum.reduceat(e1rm, starts)
+    volume = np.add.reduceat(set_volume, starts)
+    total_reps = np.add.reduceat(cols.reps, starts)
+
+    # Trailing time window (inclusive of the current workout) via prefix sums
+    cumulative = np.r_[0.0, np.cumsum(volume)]
+    left = np.searchsorted(epochs, epochs - window_days * 86400.0, side="right")
+    rolling_volume = cumulative[1:] - cumulative[left]
+
+    # Average load relative to the best e1RM reached so far
+    avg_load = np.divide(volume, total_reps, out=np.zeros_like(volume), where=total_reps > 0)
+    running_best = np.maximum.accumulate(best_e1rm)
+    relative_intensity = np.divide(
+        avg_load,
+        running_best,
+        out=np.zeros_like(avg_load),
+        where=running_best > 0,
+    )
+
+    return StrengthSeries(
+        epochs=epochs,
+        best_e1rm=best_e1rm,
+        volume=volume,
+        rolling_volume=rolling_volume,
+        relative_intensity=relative_intensity,
+    )
@@ -0,0 +1,263 @@
+import asyncio
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, undefer_group
+
+from app.api.schemas.exercise_template import (
+    ExerciseTemplateDetailResponse,
+    ExerciseTemplateResponse,
+)
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.catalog_version import TEMPLATE_CATALOG, CatalogVersion
+from app.models.exercise_template import ExerciseTemplate
+
+# Exact-match filters answered from the inverted indexes (query param == column name)
+INDEXED_FIELDS = ("category", "equipment", "tracking_type", "level", "force", "mechanic")
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    response: ExerciseTemplateResponse
+    name_lower: str
+    muscles: frozenset[str]
+
+
+# Detail payload serialized once per catalog version; the ETag hashes the bytes,
+# so it only changes when the template itself changed.
+@dataclass(frozen=True)
+class CatalogDetail:
+    body: bytes
+    etag: str
+
+
+def _build_detail(t: ExerciseTemplate) -> CatalogDetail:
+    body = ExerciseTemplateDetailResponse(
+        id=t.id,
+        source_id=t.source_id,
+        slug=t.slug,
+        name=t.name,
+        category=t.category,
+        equipment=t.equipment,
+        tracking_type=t.tracking_type,
+        description=t.description,
+        image_url=t.image_url,
+        force=t.force,
+        level=t.level,
+        mechanic=t.mechanic,
+        primary_muscles=t.primary_muscles,
+        secondary_muscles=t.secondary_muscles,
+        instructions=t.instructions,
+    ).model_dump_json().encode("utf-8")
+    return CatalogDetail(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+# Immutable snapshot of exercise_templates, ordered like the DB listing (name, id).
+# Filters resolve to sets of positions, so results come out in list order.
+class TemplateCatalog:
+    def __init__(self, version: int, templates: list[ExerciseTemplate]) -> None:
+        self.version = version
+        self.entries: tuple[CatalogEntry, ...] = tuple(
+            CatalogEntry(
+                response=ExerciseTemplateResponse(
+                    id=t.id,
+                    source_id=t.source_id,
+                    slug=t.slug,
+                    name=t.name,
+                    category=t.category,
+                    equipment=t.equipment,
+                    tracking_type=t.tracking_type,
+                ),
+                name_lower=t.name.lower(),
+                muscles=frozenset(m.lower() for m in [*t.primary_muscles, *t.secondary_muscles]),
+            )
+            for t in templates
+        )
+        self.all_positions = frozenset(range(len(self.entries)))
+        self.position_by_id = {e.response.id: i for i, e in enumerate(self.entries)}
+
+        self.details_by_id = {t.id: _build_detail(t) for t in templates}
+        self.id_by_slug = {t.slug: t.id for t in templates}
+
+        # field -> value -> positions
+        index: dict[str, dict[str, set[int]]] = {f: defaultdict(set) for f in INDEXED_FIELDS}
+        muscle_index: dict[str, set[int]] = defaultdict(set)
+        for i, t in enumerate(templates):
+            for field in INDEXED_FIELDS:
+                value = getattr(t, field)
+                if value is not None:
+                    index[field][value].add(i)
+            for m in self.entries[i].muscles:
+                muscle_index[m].add(i)
+
+        self.index = {f: {v: frozenset(p) for v, p in values.items()} for f, values in index.items()}
+        self.muscle_index = {m: frozenset(p) for m, p in muscle_index.items()}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def filter(
+            self,
+            q: str | None = None,
+            muscles: list[str] | None = None,
+            muscle_match: str = "any",
+            **fields: str | None,
+    ) -> list[int]:
+        # Intersect the smallest sets first; an empty set short-circuits
+        sets = [
+            self.index[field].get(value.lower(), frozenset())
+            for field, value in fields.items()
+            if value
+        ]
+        if muscles:
+            per_muscle = [
+                self.muscle_index.get(m, frozenset())
+                for m in sorted({m.lower() for m in muscles})
+            ]
+            if muscle_match == "any":
+                sets.append(frozenset().union(*per_muscle))
+            else:
+                sets.extend(per_muscle)
+
+        if sets:
+            sets.sort(key=len)
+            matched = sets[0].intersection(*sets[1:])
+        else:
+            matched = self.all_positions
+
+        if q:
+            needle = q.lower()
+            matched = [p for p in matched if needle in self.entries[p].name_lower]
+
+        return sorted(matched)
+
+    # Lookup by numeric id or slug; only ASCII digits count as an id ("²".isdigit() is true)
+    def detail(self, ref: str) -> CatalogDetail | None:
+        template_id = int(ref) if ref.isascii() and ref.isdecimal() else self.id_by_slug.get(ref)
+        return self.details_by_id.get(template_id)
+
+    # Position right after the (name, id) cursor. Entries follow the DB collation,
+    # which Python can't reproduce, so a cursor from an older catalog version
+    # (template renamed or removed) restarts at the first page.
+    def position_after(self, name: str, template_id: int) -> int:
+        pos = self.position_by_id.get(template_id)
+        if pos is not None and self.entries[pos].response.name == name:
+            return pos + 1
+        return 0
+
+
+_catalog: TemplateCatalog | None = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+# (catalog version, normalized filters) -> total for searches that still run in Postgres
+_count_cache = TTLCache(
+    maxsize=settings.template_count_cache_max_entries,
+    ttl_seconds=settings.template_count_cache_ttl_seconds,
+)
+
+
+def _current_version(db: Session) -> int:
+    version = db.scalar(
+        select(CatalogVersion.version).where(CatalogVersion.name == TEMPLATE_CATALOG)
+    )
+    return version or 0
+
+
+def _load(db: Session, version: int) -> TemplateCatalog:
+    # Detail payloads are built here, so the deferred detail columns are loaded too
+    templates = (
+        db.query(ExerciseTemplate)
+        .options(undefer_group("details"))
+        .order_by(ExerciseTemplate.name.asc(), ExerciseTemplate.id.asc())
+        .all()
+    )
+    return TemplateCatalog(version, templates)
+
+
+def reload_catalog(db: Session) -> TemplateCatalog:
+    global _catalog, _checked_at
+    with _lock:
+        # Version is read first: a reseed racing the load only causes one extra reload
+        version = _current_version(db)
+        _catalog = _load(db, version)
+        _checked_at = time.monotonic()
+        return _catalog
+
+
+# Current catalog; the DB is asked for the version at most every
+# template_catalog_check_seconds and the rows only when that version changed.
+def get_catalog(db: Session) -> TemplateCatalog:
+    global _catalog, _checked_at
+    catalog = _catalog
+    if catalog is not None and time.monotonic() - _checked_at < settings.template_catalog_check_seconds:
+        return catalog
+
+    with _lock:
+        if _catalog is not None and time.monotonic() - _checked_at < settings.template_catalog_check_seconds:
+            return _catalog
+
+        version = _current_version(db)
+        if _catalog is None or _catalog.version != version:
+            _catalog = _load(db, version)
+        _checked_at = time.monotonic()
+        return _catalog
+
+
+# The thread lock above would block the event loop while another request awaits
+# the reload; requests on the loop queue on an asyncio lock instead.
+_async_lock = asyncio.Lock()
+
+
+async def get_catalog_async(db: AsyncSession) -> TemplateCatalog:
+    catalog = _catalog
+    if catalog is not None and time.monotonic() - _checked_at < settings.template_catalog_check_seconds:
+        return catalog
+
+    async with _async_lock:
+        return await db.run_sync(get_catalog)
+
+
+# Called by whoever rewrites exercise_templates (e.g. the seed script)
+def bump_catalog_version(db: Session) -> None:
+    stmt = pg_insert(CatalogVersion).values(name=TEMPLATE_CATALOG, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CatalogVersion.name],
+        set_={"version": CatalogVersion.version + 1, "updated_at": func.now()},
+    )
+    db.execute(stmt)
+
+
+# Filters differing only in case/order share one cache entry (all matching is case-insensitive)
+def count_key(
+        muscles: list[str] | None = None,
+        **params: str | None,
+) -> tuple:
+    normalized = tuple(
+        (name, value.lower())
+        for name, value in sorted(params.items())
+        if value
+    )
+    return normalized, tuple(sorted({m.lower() for m in muscles or []}))
+
+
+async def cached_count(
+        catalog: TemplateCatalog,
+        key: tuple,
+        count: Callable[[], Awaitable[int]],
+) -> int:
+    # The catalog version in the key drops every cached total on reseed
+    full_key = (catalog.version, key)
+    total = _count_cache.get(full_key)
+    if total is None:
+        total = await count()
+        _count_cache.set(full_key, total)
+    return total
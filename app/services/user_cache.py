@@ -0,0 +1,39 @@
+from sqlalchemy import event
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.user import User
+
+# user_id -> (id, email) of the authenticated principal. Only plain values are
+# cached; every request gets its own transient User, never a shared ORM instance.
+_user_cache = TTLCache(
+    maxsize=settings.user_cache_max_users,
+    ttl_seconds=settings.user_cache_ttl_seconds,
+)
+
+
+def get_cached_user(user_id: int) -> User | None:
+    cached = _user_cache.get(user_id)
+    if cached is None:
+        return None
+    return User(id=cached[0], email=cached[1])
+
+
+def cache_user(user: User) -> None:
+    _user_cache.set(user.id, (user.id, user.email))
+
+
+def invalidate_user(user_id: int) -> None:
+    _user_cache.invalidate(user_id)
+
+
+def user_cache_stats() -> dict[str, int]:
+    return _user_cache.stats()
+
+
+# ORM writes to a user drop the cached principal. Bulk UPDATE/DELETE statements
+# bypass these events; callers doing those must call invalidate_user themselves.
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_change(mapper, connection, target: User) -> None:
+    invalidate_user(target.id)
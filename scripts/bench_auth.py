@@ -0,0 +1,79 @@
+import asyncio
+import statistics
+import time
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user
+from app.core import tokens
+from app.core.db import async_engine
+from app.models.user import User
+from app.services import user_cache
+
+ITERATIONS = 5_000
+
+
+async def timed_us(call) -> float:
+    samples = []
+    for _ in range(ITERATIONS):
+        t0 = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - t0) * 1_000_000)
+    return statistics.median(samples)
+
+
+def set_enabled(cache, maxsize: int) -> None:
+    cache.clear()
+    cache.maxsize = maxsize
+
+
+async def decode(token: str) -> dict:
+    return tokens.decode_access_token(token)
+
+
+async def run() -> None:
+    connection = await async_engine.connect()
+    outer = await connection.begin()
+    db = AsyncSession(
+        bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False
+    )
+    try:
+        user = User(email="bench-auth@example.invalid", password_hash="x")
+        db.add(user)
+        await db.flush()
+
+        token = tokens.create_access_token(subject=str(user.id))
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        token_cache = tokens._token_cache
+        users = user_cache._user_cache
+        token_max, user_max = token_cache.maxsize, users.maxsize
+
+        print(f"median of {ITERATIONS} calls")
+        for label, token_on, user_on in [
+            ("no caches (before)", False, False),
+            ("token cache", True, False),
+            ("token + user cache", True, True),
+        ]:
+            set_enabled(token_cache, token_max if token_on else 0)
+            set_enabled(users, user_max if user_on else 0)
+
+            decode_us = await timed_us(lambda: decode(token))
+            # Fresh identity map each call, like a new request session
+            chain_us = await timed_us(
+                lambda: (db.expunge_all(), get_current_user(db=db, credentials=credentials))[1]
+            )
+            print(f"{label:20} decode_access_token {decode_us:7.1f} us   get_current_user {chain_us:7.1f} us")
+
+        set_enabled(token_cache, token_max)
+        set_enabled(users, user_max)
+    finally:
+        await db.close()
+        await outer.rollback()
+        await connection.close()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
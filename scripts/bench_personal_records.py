@@ -0,0 +1,93 @@
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.db import SessionLocal, engine
+from app.models.exercise import Exercise
+from app.models.user import User
+from app.models.workout import Workout
+from app.models.workout_set import WorkoutSet
+from app.services.personal_records import get_personal_records, rebuild_personal_records
+
+EXERCISE_COUNTS = [10, 50, 150]
+SETS_PER_EXERCISE = 20
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.count += 1
+
+
+def seed_user(db: Session, exercise_count: int) -> User:
+    user = User(email=f"bench-prs-{exercise_count}@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+
+    workout = Workout(user_id=user.id, started_at=datetime.now(tz=timezone.utc))
+    db.add(workout)
+    db.flush()
+
+    tracking_types = ["weight_reps", "time", "distance"]
+    for i in range(exercise_count):
+        tracking = tracking_types[i % len(tracking_types)]
+        ex = Exercise(
+            user_id=user.id,
+            name=f"Bench Exercise {i}",
+            name_normalized=f"bench exercise {i}",
+            muscle_group="chest",
+            equipment="barbell",
+            category="strength",
+            tracking_type=tracking,
+        )
+        db.add(ex)
+        db.flush()
+
+        for n in range(1, SETS_PER_EXERCISE + 1):
+            db.add(
+                WorkoutSet(
+                    workout_id=workout.id,
+                    exercise_id=ex.id,
+                    set_number=n,
+                    reps=5 + n % 5 if tracking == "weight_reps" else None,
+                    weight_kg=20 + n * 2.5 if tracking == "weight_reps" else None,
+                    duration_seconds=30 * n if tracking == "time" else None,
+                    distance_meters=100 * n if tracking == "distance" else None,
+                )
+            )
+    db.flush()
+    return user
+
+
+def run() -> None:
+    counter = QueryCounter()
+
+    for exercise_count in EXERCISE_COUNTS:
+        db: Session = SessionLocal()
+        try:
+            user = seed_user(db, exercise_count)
+            rebuild_personal_records(db, user_id=user.id)
+
+            event.listen(engine, "before_cursor_execute", counter)
+            counter.count = 0
+            t0 = time.perf_counter()
+            results = get_personal_records(db, user.id)
+            elapsed_ms = (time.perf_counter() - t0) * 1000
+            event.remove(engine, "before_cursor_execute", counter)
+
+            print(
+                f"exercises={exercise_count} results={len(results)} "
+                f"queries={counter.count} time_ms={elapsed_ms:.1f}"
+            )
+        finally:
+            # Never persist benchmark data
+            db.rollback()
+            db.close()
+
+
+if __name__ == "__main__":
+    run()
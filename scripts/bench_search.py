@@ -0,0 +1,85 @@
+import asyncio
+import statistics
+import time
+
+from fastapi import Response
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routes import exercise_templates, exercises
+from app.core.db import async_engine
+from app.models.user import User
+
+SYNTHETIC_EXERCISES = 10_000
+ROUNDS = 20
+TERMS = ["benchpress", "bench press", "squat", "dumbell row", "curl", "tricep pushdown"]
+
+# Synthetic names are built from catalog names so fuzzy terms have realistic hits
+SEED_SQL = """
+INSERT INTO exercises (user_id, name, name_normalized, muscle_group, equipment, category, tracking_type)
+SELECT :user_id, t.name || ' #' || n, lower(t.name) || ' #' || n, 'chest', t.equipment, t.category, t.tracking_type
+FROM generate_series(1, :count) n
+JOIN LATERAL (
+    SELECT name, equipment, category, tracking_type
+    FROM exercise_templates
+    OFFSET (n % (SELECT count(*) FROM exercise_templates)) LIMIT 1
+) t ON true
+"""
+
+
+async def timed_ms(call) -> tuple[float, int]:
+    samples = []
+    result = []
+    for _ in range(ROUNDS):
+        t0 = time.perf_counter()
+        result = await call()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples), len(result)
+
+
+async def run() -> None:
+    connection = await async_engine.connect()
+    outer = await connection.begin()
+    db = AsyncSession(
+        bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False
+    )
+    try:
+        user = User(email="bench-search@example.invalid", password_hash="x")
+        db.add(user)
+        await db.flush()
+        await db.execute(text(SEED_SQL), {"user_id": user.id, "count": SYNTHETIC_EXERCISES})
+        await db.execute(text("ANALYZE exercises"))
+
+        catalog_size = await db.scalar(text("SELECT count(*) FROM exercise_templates"))
+        print(f"catalog={catalog_size} templates, user exercises={SYNTHETIC_EXERCISES}")
+
+        for term in TERMS:
+            for match in ("contains", "fuzzy"):
+                tpl_ms, tpl_hits = await timed_ms(
+                    lambda: exercise_templates.list_templates(
+                        Response(), db=db, q=term, match=match, search=None, category=None,
+                        equipment=None, tracking_type=None, level=None, force=None, mechanic=None,
+                        muscle=None, muscle_match="any", limit=20, after=None, offset=0,
+                        include_total=True,
+                    )
+                )
+                ex_ms, ex_hits = await timed_ms(
+                    lambda: exercises.list_exercises(
+                        Response(), db=db, current_user=user, q=term, match=match,
+                        limit=20, after=None, offset=0,
+                    )
+                )
+                print(
+                    f"q={term!r:20} match={match:8} "
+                    f"templates: {tpl_ms:6.2f} ms ({tpl_hits} hits)  "
+                    f"exercises: {ex_ms:6.2f} ms ({ex_hits} hits)"
+                )
+    finally:
+        await db.close()
+        await outer.rollback()
+        await connection.close()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,86 @@
+import time
+
+import numpy as np
+
+from app.services.strength import StrengthColumns, compute_strength_series
+
+SET_COUNT = 100_000
+SETS_PER_WORKOUT = 20
+ROUNDS = 5
+
+
+def synthetic_columns(set_count: int) -> StrengthColumns:
+    rng = np.random.default_rng(42)
+    workout_ids = np.arange(set_count, dtype=np.int64) // SETS_PER_WORKOUT
+    # One workout every ~2 days
+    epochs = 1_600_000_000.0 + workout_ids * 2 * 86400.0
+    weights = np.round(rng.uniform(20, 180, set_count) / 2.5) * 2.5
+    reps = rng.integers(1, 15, set_count).astype(np.float64)
+    return StrengthColumns(workout_ids, epochs, weights, reps)
+
+
+# Row-by-row reference implementation (the style used before this module existed)
+def python_loop(cols: StrengthColumns, window_days: int = 28) -> list[tuple]:
+    per_workout: dict[int, list[float]] = {}
+    order: list[int] = []
+    for wid, epoch, w, r in zip(
+            cols.workout_ids.tolist(),
+            cols.epochs.tolist(),
+            cols.weights.tolist(),
+            cols.reps.tolist(),
+    ):
+        e1rm = w if r <= 1 else w * (1 + r / 30)
+        agg = per_workout.get(wid)
+        if agg is None:
+            per_workout[wid] = agg = [epoch, 0.0, 0.0, 0.0]
+            order.append(wid)
+        agg[1] = max(agg[1], e1rm)
+        agg[2] += w * r
+        agg[3] += r
+
+    result = []
+    best_so_far = 0.0
+    window = window_days * 86400.0
+    left = 0
+    rolling = 0.0
+    for wid in order:
+        epoch, best, volume, total_reps = per_workout[wid]
+        best_so_far = max(best_so_far, best)
+        rolling += volume
+        while per_workout[order[left]][0] <= epoch - window:
+            rolling -= per_workout[order[left]][2]
+            left += 1
+        intensity = (volume / total_reps) / best_so_far if total_reps and best_so_far else 0.0
+        result.append((epoch, best, volume, rolling, intensity))
+    return result
+
+
+def timed(fn, *args) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def run() -> None:
+    cols = synthetic_columns(SET_COUNT)
+
+    vectorized_ms = timed(compute_strength_series, cols)
+    loop_ms = timed(python_loop, cols)
+
+    series = compute_strength_series(cols)
+    reference = python_loop(cols)
+    assert np.allclose(series.best_e1rm, [r[1] for r in reference])
+    assert np.allclose(series.rolling_volume, [r[3] for r in reference])
+
+    print(
+        f"sets={SET_COUNT} workouts={series.epochs.size} "
+        f"numpy_ms={vectorized_ms:.1f} python_loop_ms={loop_ms:.1f} "
+        f"speedup={loop_ms / vectorized_ms:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,87 @@
+import asyncio
+import itertools
+import statistics
+import time
+
+from fastapi import Response
+
+from app.api.routes import exercise_templates
+from app.core.db import AsyncSessionLocal, SessionLocal, async_engine
+from app.services import template_catalog
+
+CONCURRENCY = 8
+REQUESTS = 800
+
+# Mix of ranked (Postgres) and plain (in-memory catalog) listings
+WORKLOAD = [
+    {"search": "bench press"},
+    {"search": "chest", "equipment": "barbell"},
+    {"search": "curl", "muscle": ["biceps"]},
+    {"search": "squat", "level": "beginner"},
+    {"category": "strength", "muscle": ["chest", "triceps"]},
+    {"q": "press", "equipment": "dumbbell"},
+    {},
+]
+
+DEFAULTS = {
+    "q": None, "match": "contains", "search": None, "category": None, "equipment": None,
+    "tracking_type": None, "level": None, "force": None, "mechanic": None, "muscle": None,
+    "muscle_match": "any", "limit": 20, "after": None, "offset": 0,
+}
+
+
+async def call(params: dict, include_total: bool) -> float:
+    async with AsyncSessionLocal() as db:
+        t0 = time.perf_counter()
+        await exercise_templates.list_templates(
+            Response(), db=db, include_total=include_total, **{**DEFAULTS, **params}
+        )
+        return (time.perf_counter() - t0) * 1000
+
+
+async def run_mode(label: str, include_total: bool) -> None:
+    jobs = itertools.islice(itertools.cycle(WORKLOAD), REQUESTS)
+    samples: list[float] = []
+
+    async def worker() -> None:
+        for params in jobs:
+            samples.append(await call(params, include_total))
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(CONCURRENCY)])
+    elapsed = time.perf_counter() - t0
+    samples.sort()
+
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(
+        f"{label:28} {REQUESTS / elapsed:8.0f} req/s  "
+        f"p50 {statistics.median(samples):6.2f} ms  p95 {p95:6.2f} ms"
+    )
+
+
+async def run() -> None:
+    db = SessionLocal()
+    try:
+        catalog = template_catalog.reload_catalog(db)
+    finally:
+        db.close()
+    print(f"catalog={len(catalog)} templates, {CONCURRENCY} concurrent, {REQUESTS} requests per mode")
+
+    cache = template_catalog._count_cache
+    maxsize = cache.maxsize
+
+    # "Before": every request runs query.count() (cache disabled)
+    cache.clear()
+    cache.maxsize = 0
+    await run_mode("count every request", include_total=True)
+
+    cache.maxsize = maxsize
+    cache.clear()
+    await run_mode("cached counts", include_total=True)
+    await run_mode("include_total=false", include_total=False)
+    print(f"count cache: {cache.stats()}")
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
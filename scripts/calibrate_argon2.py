@@ -0,0 +1,96 @@
+import argparse
+import os
+import statistics
+import time
+from pathlib import Path
+
+from argon2 import PasswordHasher
+
+from app.core.config import settings
+
+SAMPLES = 5
+MAX_TIME_COST = 10
+# OWASP floor for Argon2id (19 MiB with t=2); never calibrate below it
+MIN_MEMORY_KIB = 19 * 1024
+
+ENV_FILE = Path(".env")
+
+
+def measure_ms(time_cost: int, memory_kib: int, parallelism: int) -> float:
+    hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_kib, parallelism=parallelism)
+    samples = []
+    for _ in range(SAMPLES):
+        t0 = time.perf_counter()
+        hasher.hash("calibration-password")
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def calibrate(target_ms: float, memory_kib: int, parallelism: int) -> tuple[int, int, float]:
+    # Memory first: halve it until a single pass fits the budget
+    ms = measure_ms(1, memory_kib, parallelism)
+    while ms > target_ms and memory_kib > MIN_MEMORY_KIB:
+        memory_kib = max(MIN_MEMORY_KIB, memory_kib // 2)
+        ms = measure_ms(1, memory_kib, parallelism)
+
+    # Then as many passes as still fit
+    time_cost = 1
+    while time_cost < MAX_TIME_COST:
+        next_ms = measure_ms(time_cost + 1, memory_kib, parallelism)
+        if next_ms > target_ms:
+            break
+        time_cost += 1
+        ms = next_ms
+
+    # OWASP minimum at the memory floor
+    if memory_kib <= MIN_MEMORY_KIB and time_cost < 2:
+        time_cost = 2
+        ms = measure_ms(time_cost, memory_kib, parallelism)
+    return time_cost, memory_kib, ms
+
+
+def write_env(values: dict[str, int]) -> None:
+    lines = ENV_FILE.read_text(encoding="utf-8").splitlines() if ENV_FILE.exists() else []
+    lines = [line for line in lines if line.split("=", 1)[0].strip().upper() not in values]
+    lines += [f"{key}={value}" for key, value in values.items()]
+    ENV_FILE.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Pick Argon2 parameters for this host")
+    parser.add_argument("--target-ms", type=float, default=100, help="hash time budget per login")
+    parser.add_argument("--memory-mib", type=int, default=settings.argon2_memory_cost_kib // 1024)
+    parser.add_argument("--parallelism", type=int, default=min(settings.argon2_parallelism, os.cpu_count() or 1))
+    parser.add_argument("--write", action="store_true", help=f"store the result in {ENV_FILE}")
+    args = parser.parse_args()
+
+    current_ms = measure_ms(
+        settings.argon2_time_cost, settings.argon2_memory_cost_kib, settings.argon2_parallelism
+    )
+    print(
+        f"current: time_cost={settings.argon2_time_cost} "
+        f"memory={settings.argon2_memory_cost_kib // 1024} MiB "
+        f"parallelism={settings.argon2_parallelism} -> {current_ms:.1f} ms"
+    )
+
+    time_cost, memory_kib, ms = calibrate(args.target_ms, args.memory_mib * 1024, args.parallelism)
+    print(
+        f"target {args.target_ms:.0f} ms: time_cost={time_cost} memory={memory_kib // 1024} MiB "
+        f"parallelism={args.parallelism} -> {ms:.1f} ms"
+    )
+
+    values = {
+        "ARGON2_TIME_COST": time_cost,
+        "ARGON2_MEMORY_COST_KIB": memory_kib,
+        "ARGON2_PARALLELISM": args.parallelism,
+    }
+    if args.write:
+        write_env(values)
+        print(f"Written to {ENV_FILE}; restart the API to apply (hashes upgrade on next login).")
+    else:
+        print("\n".join(f"{key}={value}" for key, value in values.items()))
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.calibrate_argon2 [--target-ms 100] [--write]
+    run()
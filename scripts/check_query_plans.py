@@ -0,0 +1,250 @@
+import asyncio
+import sys
+
+from fastapi import Response
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import Session
+
+from app.api.routes import exercises, progress, workouts
+from app.api.schemas.workout import WorkoutSetCreateRequest, WorkoutSetUpdateRequest
+from app.core.db import async_engine
+from app.models.exercise import Exercise
+from app.models.user import User
+from app.models.workout import Workout
+from app.services.daily_stats import rebuild_daily_stats
+from app.services.personal_records import rebuild_personal_records
+
+# Tables that grow with usage; a Seq Scan on any of them is a regression
+LARGE_TABLES = {
+    "workouts",
+    "workout_sets",
+    "exercises",
+    "exercise_personal_records",
+    "exercise_daily_stats",
+}
+
+USERS = 50
+EXERCISES_PER_USER = 30
+WORKOUTS_PER_USER = 200
+EXERCISES_PER_WORKOUT = 5
+SETS_PER_EXERCISE = 3
+
+EMAIL_PREFIX = "plan-check-"
+
+SEED_SQL = [
+    """
+    INSERT INTO users (email, password_hash)
+    SELECT :prefix || u || '@example.invalid', 'x'
+    FROM generate_series(1, :users) u
+    """,
+    """
+    INSERT INTO exercises (user_id, name, name_normalized, muscle_group, equipment, category, tracking_type)
+    SELECT u.id, 'Exercise ' || e, 'exercise ' || e, 'chest', 'barbell', 'strength', 'weight_reps'
+    FROM users u CROSS JOIN generate_series(1, :exercises) e
+    WHERE u.email LIKE :prefix || '%'
+    """,
+    """
+    INSERT INTO workouts (user_id, started_at)
+    SELECT u.id, now() - make_interval(days => w)
+    FROM users u CROSS JOIN generate_series(1, :workouts) w
+    WHERE u.email LIKE :prefix || '%'
+    """,
+    """
+    INSERT INTO workout_sets (workout_id, exercise_id, set_number, reps, weight_kg)
+    SELECT w.id, e.id, n, 1 + (w.id + n) % 12, 20 + (w.id * 7 + e.id) % 150
+    FROM workouts w
+    JOIN users u ON u.id = w.user_id
+    JOIN exercises e ON e.user_id = w.user_id AND (e.id + w.id) % :exercises < :per_workout
+    CROSS JOIN generate_series(1, :sets) n
+    WHERE u.email LIKE :prefix || '%'
+    """,
+]
+
+
+def seed(db: Session) -> None:
+    params = {
+        "prefix": EMAIL_PREFIX,
+        "users": USERS,
+        "exercises": EXERCISES_PER_USER,
+        "workouts": WORKOUTS_PER_USER,
+        "per_workout": EXERCISES_PER_WORKOUT,
+        "sets": SETS_PER_EXERCISE,
+    }
+    for sql in SEED_SQL:
+        db.execute(text(sql), params)
+
+    rebuild_personal_records(db)
+    rebuild_daily_stats(db)
+    db.flush()
+
+    # Planner statistics must reflect the seeded volume
+    for table in sorted(LARGE_TABLES):
+        db.execute(text(f"ANALYZE {table}"))
+
+
+def seq_scans(plan: dict) -> set[str]:
+    found = set()
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in LARGE_TABLES:
+        found.add(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found |= seq_scans(child)
+    return found
+
+
+class StatementRecorder:
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, object]] = []
+        self.enabled = False
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if self.enabled and not executemany:
+            self.statements.append((statement, parameters))
+
+
+async def run() -> int:
+    connection = await async_engine.connect()
+    outer = await connection.begin()
+    # Route commits become savepoint releases; everything is rolled back at the end
+    db = AsyncSession(
+        bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False
+    )
+
+    recorder = StatementRecorder()
+    event.listen(connection.sync_connection, "before_cursor_execute", recorder)
+
+    failures = 0
+    try:
+        await db.run_sync(seed)
+
+        user = (
+            await db.scalars(select(User).where(User.email == f"{EMAIL_PREFIX}1@example.invalid"))
+        ).one()
+        ex = await db.scalar(
+            select(Exercise).where(Exercise.user_id == user.id).order_by(Exercise.id).limit(1)
+        )
+        w = await db.scalar(
+            select(Workout)
+            .where(Workout.user_id == user.id)
+            .order_by(Workout.started_at.desc())
+            .limit(1)
+        )
+
+        first_page = Response()
+
+        def add_set():
+            return workouts.add_set(
+                w.id,
+                WorkoutSetCreateRequest(exercise_id=ex.id, set_number=99, reps=1, weight_kg=500),
+                db=db,
+                current_user=user,
+            )
+
+        checks = [
+            ("GET /progress/prs", lambda: progress.list_personal_records(db=db, current_user=user)),
+            ("GET /progress/overview", lambda: progress.overview(db=db, current_user=user)),
+            *[
+                (
+                    f"GET /progress/exercises/{{id}}/history?bucket={bucket}",
+                    lambda bucket=bucket: progress.exercise_history(
+                        ex.id, db=db, current_user=user, date_from=None, date_to=None,
+                        bucket=bucket, metric="max", max_points=None,
+                    ),
+                )
+                for bucket in ("workout", "day", "week", "month")
+            ],
+            (
+                "GET /progress/exercises/{id}/strength",
+                lambda: progress.exercise_strength(
+                    ex.id, db=db, current_user=user, formula="epley", window_days=28,
+                ),
+            ),
+            (
+                "GET /workouts",
+                lambda: workouts.list_workouts(
+                    first_page, db=db, current_user=user, limit=50, after=None, offset=0,
+                ),
+            ),
+            (
+                "GET /workouts?after=",
+                lambda: workouts.list_workouts(
+                    Response(), db=db, current_user=user, limit=50,
+                    after=first_page.headers["X-Next-Cursor"], offset=0,
+                ),
+            ),
+            ("GET /workouts/{id}", lambda: workouts.get_workout(w.id, db=db, current_user=user)),
+            (
+                "GET /exercises",
+                lambda: exercises.list_exercises(
+                    Response(), db=db, current_user=user, q=None, limit=50, after=None, offset=0,
+                ),
+            ),
+            ("POST /workouts/{id}/sets", add_set),
+        ]
+
+        new_set_ids: list[int] = []
+        for name, call in checks:
+            recorder.statements.clear()
+            recorder.enabled = True
+            result = await call()
+            recorder.enabled = False
+            if name == "POST /workouts/{id}/sets":
+                new_set_ids.append(result.id)
+
+            failures += await explain(connection, name, recorder.statements)
+
+        # Editing/deleting the new PR set triggers the recompute paths
+        for name, call in [
+            (
+                "PUT /workouts/{id}/sets/{set_id}",
+                lambda: workouts.update_set(
+                    w.id, new_set_ids[0], WorkoutSetUpdateRequest(weight_kg=10),
+                    db=db, current_user=user,
+                ),
+            ),
+            (
+                "DELETE /workouts/{id}/sets/{set_id}",
+                lambda: workouts.delete_set(w.id, new_set_ids[0], db=db, current_user=user),
+            ),
+        ]:
+            recorder.statements.clear()
+            recorder.enabled = True
+            await call()
+            recorder.enabled = False
+            failures += await explain(connection, name, recorder.statements)
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", recorder)
+        await db.close()
+        await outer.rollback()
+        await connection.close()
+        await async_engine.dispose()
+
+    print("FAILED" if failures else "OK", f"({failures} statement(s) with seq scans)")
+    return 1 if failures else 0
+
+
+async def explain(connection: AsyncConnection, name: str, statements: list[tuple[str, object]]) -> int:
+    failures = 0
+    for statement, parameters in statements:
+        if statement.lstrip().upper().startswith(("SAVEPOINT", "RELEASE", "ROLLBACK")):
+            continue
+
+        plan = (
+            await connection.exec_driver_sql(
+                "EXPLAIN (FORMAT JSON) " + statement,
+                parameters,
+            )
+        ).scalar_one()
+        tables = seq_scans(plan[0]["Plan"])
+        if tables:
+            failures += 1
+            print(f"[SEQ SCAN] {name}: {', '.join(sorted(tables))}")
+            print("    " + " ".join(statement.split())[:300])
+
+    if not failures:
+        print(f"[ok] {name} ({len(statements)} statement(s))")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run()))
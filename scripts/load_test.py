@@ -0,0 +1,140 @@
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+import uuid
+from collections import Counter
+
+# Dev dependency group (uv sync installs it)
+import httpx
+
+EXERCISES = 10
+WORKOUTS = 30
+SETS_PER_WORKOUT = 6
+
+# Authenticated, DB-backed reads that dominate app traffic
+ENDPOINTS = [
+    "/workouts?limit=20",
+    "/exercises?limit=50",
+    "/progress/prs",
+    "/workouts/{workout_id}",
+    "/exercises?q=exercise",
+    "/progress/exercises/{exercise_id}/history?bucket=week",
+]
+
+
+async def setup(client: httpx.AsyncClient) -> tuple[dict, int, int]:
+    email = f"load-{uuid.uuid4().hex[:10]}@example.com"
+    password = "load-test-password"
+    r = await client.post("/auth/register", json={"email": email, "password": password})
+    r.raise_for_status()
+    r = await client.post("/auth/login", json={"email": email, "password": password})
+    r.raise_for_status()
+    headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+    exercise_ids = []
+    for i in range(EXERCISES):
+        r = await client.post(
+            "/exercises",
+            headers=headers,
+            json={
+                "name": f"Load Exercise {i}",
+                "muscle_group": "chest",
+                "equipment": "barbell",
+                "category": "strength",
+                "tracking_type": "weight_reps",
+            },
+        )
+        r.raise_for_status()
+        exercise_ids.append(r.json()["id"])
+
+    workout_id = 0
+    for w in range(WORKOUTS):
+        r = await client.post("/workouts", headers=headers, json={"notes": f"load {w}"})
+        r.raise_for_status()
+        workout_id = r.json()["id"]
+        sets = [
+            {
+                "exercise_id": exercise_ids[(w + n) % EXERCISES],
+                "set_number": n + 1,
+                "reps": 5 + n,
+                "weight_kg": 40 + 2.5 * ((w * 7 + n) % 20),
+            }
+            for n in range(SETS_PER_WORKOUT)
+        ]
+        r = await client.post(f"/workouts/{workout_id}/sets/batch", headers=headers, json={"sets": sets})
+        r.raise_for_status()
+
+    return headers, workout_id, exercise_ids[0]
+
+
+async def worker(
+        url: str,
+        headers: dict,
+        paths: itertools.cycle,
+        measure_from: float,
+        deadline: float,
+        latencies: list[float],
+        statuses: Counter,
+) -> None:
+    # One keep-alive connection per worker; a shared pool of hundreds of connections
+    # costs the client more CPU than the server spends on the request
+    limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        while time.perf_counter() < deadline:
+            path = next(paths)
+            t0 = time.perf_counter()
+            try:
+                r = await client.get(path, headers=headers)
+            except httpx.HTTPError as exc:
+                r = None
+                status_key = type(exc).__name__
+            else:
+                status_key = r.status_code
+            if t0 < measure_from:
+                continue
+            statuses[status_key] += 1
+            if r is not None:
+                latencies.append((time.perf_counter() - t0) * 1000)
+
+
+async def run(url: str, concurrency: int, duration: float, warmup: float) -> None:
+    async with httpx.AsyncClient(base_url=url, timeout=60) as client:
+        headers, workout_id, exercise_id = await setup(client)
+        paths = itertools.cycle(
+            [p.format(workout_id=workout_id, exercise_id=exercise_id) for p in ENDPOINTS]
+        )
+
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    # Warm-up at full concurrency so connection setup (ours and the DB pool's) is not measured
+    t0 = time.perf_counter() + warmup
+    deadline = t0 + duration
+    await asyncio.gather(
+        *[worker(url, headers, paths, t0, deadline, latencies, statuses) for _ in range(concurrency)]
+    )
+    elapsed = time.perf_counter() - t0
+
+    if not latencies:
+        print(f"concurrency={concurrency}: no successful requests, statuses={dict(statuses)}")
+        return
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1] if latencies else float("nan")
+    print(
+        f"concurrency={concurrency} duration={elapsed:.1f}s requests={len(latencies)} "
+        f"throughput={len(latencies) / elapsed:.0f} req/s "
+        f"p50={statistics.median(latencies):.1f} ms p99={p99:.1f} ms statuses={dict(statuses)}"
+    )
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.load_test [--url http://127.0.0.1:8000] [--concurrency 200]
+    parser = argparse.ArgumentParser(description="HTTP load test against a running API")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--warmup", type=float, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.concurrency, args.duration, args.warmup))
@@ -0,0 +1,22 @@
+import sys
+
+from sqlalchemy.orm import Session
+
+from app.core.db import SessionLocal
+from app.services.daily_stats import rebuild_daily_stats
+
+
+def rebuild(user_id: int | None = None) -> None:
+    db: Session = SessionLocal()
+    try:
+        rows = rebuild_daily_stats(db, user_id=user_id)
+        db.commit()
+        scope = f"user_id={user_id}" if user_id is not None else "all users"
+        print(f"Rebuild done ({scope}). rows={rows}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.rebuild_daily_stats [user_id]
+    rebuild(int(sys.argv[1]) if len(sys.argv) > 1 else None)
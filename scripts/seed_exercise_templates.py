@@ -1,14 +1,36 @@
+import hashlib
 import json
 import re
+import time
 from pathlib import Path
 
+from sqlalchemy import literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.core.db import SessionLocal
 from app.models.exercise_template import ExerciseTemplate
+from app.services.template_catalog import bump_catalog_version
 
 DATA_FILE = Path("data/free-exercise-db.exercises.json")
 
+BATCH_SIZE = 500
+
+# Columns owned by the dataset; description/image_url are ours and never overwritten
+DATASET_COLUMNS = (
+    "slug",
+    "name",
+    "category",
+    "equipment",
+    "tracking_type",
+    "force",
+    "level",
+    "mechanic",
+    "primary_muscles",
+    "secondary_muscles",
+    "instructions",
+)
+
 
 def slugify(value: str) -> str:
     value = value.strip().lower()
@@ -25,58 +47,95 @@ def map_tracking_type(category: str) -> str:
     return "time"
 
 
+def content_hash(row: dict) -> str:
+    payload = json.dumps([row[c] for c in DATASET_COLUMNS], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def to_row(item: dict) -> dict | None:
+    source_id = item.get("id")
+    name = item.get("name")
+    if not source_id or not name:
+        return None
+
+    category = (item.get("category") or "strength").lower()
+    row = {
+        "source_id": source_id,
+        "slug": slugify(source_id),
+        "name": name,
+        "category": category,
+        "equipment": (item.get("equipment") or "body").lower(),
+        "tracking_type": map_tracking_type(category),
+        "force": item.get("force"),
+        "level": item.get("level"),
+        "mechanic": item.get("mechanic"),
+        "primary_muscles": item.get("primaryMuscles") or [],
+        "secondary_muscles": item.get("secondaryMuscles") or [],
+        "instructions": item.get("instructions") or [],
+    }
+    row["content_hash"] = content_hash(row)
+    return row
+
+
+def upsert_statement():
+    table = ExerciseTemplate.__table__
+    stmt = pg_insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.source_id],
+        set_={c: stmt.excluded[c] for c in (*DATASET_COLUMNS, "content_hash")},
+        # Unchanged rows are neither written nor returned
+        where=table.c.content_hash.is_distinct_from(stmt.excluded.content_hash),
+    )
+    # xmax = 0 only for freshly inserted tuples
+    return stmt.returning(literal_column("xmax = 0"))
+
+
+def upsert_batch(db: Session, rows: list[dict]) -> tuple[int, int]:
+    # Parameter list -> SQLAlchemy sends multi-row VALUES pages from one cached statement
+    inserted = db.connection().execute(upsert_statement(), rows).scalars().all()
+    created = sum(inserted)
+    return created, len(inserted) - created
+
+
 def seed() -> None:
     if not DATA_FILE.exists():
         raise FileNotFoundError(f"Missing dataset: {DATA_FILE}")
 
+    started = time.perf_counter()
     items = json.loads(DATA_FILE.read_text(encoding="utf-8"))
 
+    # Last occurrence wins; one statement may not touch the same source_id twice
+    rows: dict[str, dict] = {}
+    skipped = 0
+    for item in items:
+        row = to_row(item)
+        if row is None:
+            skipped += 1
+            continue
+        rows[row["source_id"]] = row
+
     db: Session = SessionLocal()
     try:
         created = 0
-        skipped = 0
-
-        for item in items:
-            source_id = item.get("id")
-            name = item.get("name")
-            category = (item.get("category") or "strength").lower()
-            equipment = (item.get("equipment") or "body").lower()
-
-            if not source_id or not name:
-                skipped += 1
-                continue
-
-            exists = db.query(ExerciseTemplate).filter(ExerciseTemplate.source_id == source_id).first()
-            if exists:
-                skipped += 1
-                continue
-
-            primary = item.get("primaryMuscles") or []
-            secondary = item.get("secondaryMuscles") or []
-            instructions = item.get("instructions") or []
-
-            template = ExerciseTemplate(
-                source_id=source_id,
-                slug=slugify(source_id),
-                name=name,
-                description=None,  # keep null for now (LP later)
-                image_url=None,  # you will add your own images later
-                category=category,
-                equipment=equipment,
-                tracking_type=map_tracking_type(category),
-                force=item.get("force"),
-                level=item.get("level"),
-                mechanic=item.get("mechanic"),
-                primary_muscles=primary,
-                secondary_muscles=secondary,
-                instructions=instructions,
-            )
-
-            db.add(template)
-            created += 1
+        updated = 0
+
+        batch = list(rows.values())
+        for i in range(0, len(batch), BATCH_SIZE):
+            c, u = upsert_batch(db, batch[i:i + BATCH_SIZE])
+            created += c
+            updated += u
 
+        if created or updated:
+            # Running API workers pick up the changes on their next version check
+            bump_catalog_version(db)
         db.commit()
-        print(f"Seed done. created={created}, skipped={skipped}")
+
+        unchanged = len(rows) - created - updated
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(
+            f"Seed done in {elapsed_ms:.0f} ms. created={created}, updated={updated}, "
+            f"unchanged={unchanged}, skipped={skipped}"
+        )
     finally:
         db.close()
 